@@ -12,12 +12,19 @@ except ImportError:
     PANDAS_AVAILABLE = False
     pd = None
 
-import plotly.express as px
-import plotly.graph_objects as go
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+import numpy as np
 from datetime import datetime
 from typing import List, Dict, Optional
 import os
 import sys
+import math
 import logging
 import warnings
 
@@ -58,45 +65,121 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from loader import ReportLoader
 from analytics import ReportAnalytics
-from ai import AIAnalyzer
+from ai import AIAnalyzer, compute_report_cache_key
 import json
-import stat
 import hashlib
+import heapq
+import mmap
+import threading
+from bisect import bisect_right
+from contextlib import suppress
+from itertools import islice
+from operator import itemgetter
+
+# JSON File Helpers
+# Files at least this large are memory-mapped for orjson instead of copied into a bytes object
+MMAP_MIN_BYTES = 1024 * 1024
+
+def read_json_file(path):
+    """Parse a JSON file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        raw_data = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw_data)
+    return json.loads(raw_data)
+
+def write_json_file(path, data):
+    """Write data as indented UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+def read_json_lines(path):
+    """Parse a JSON Lines file into a list of records, skipping blank or truncated lines"""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    records = []
+    with open(path, 'rb') as f:
+        for line in f:
+            # A line cut short by an interrupted append is dropped rather than failing the whole file
+            with suppress(ValueError):
+                records.append(loads(line))
+    return records
+
+def append_json_line(path, record):
+    """Append one record to a JSON Lines file"""
+    if ORJSON_AVAILABLE:
+        line = orjson.dumps(record) + b"\n"
+    else:
+        line = (json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8')
+    with open(path, 'ab') as f:
+        f.write(line)
+
+@st.cache_resource(show_spinner=False)
+def get_json_memo():
+    """Get the process-wide memo of parsed JSON files, shared by every session and rerun"""
+    return {}
+
+def get_file_signature(path):
+    """Return the (mtime, size) pair that identifies one version of a file"""
+    file_stat = os.stat(path)
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+def read_json_memoized(path, parser=read_json_file):
+    """Parse a JSON file at most once per modification, memoized process-wide by file signature"""
+    signature = get_file_signature(path)
+    memo = get_json_memo()
+    entry = memo.get(path)
+    if entry is None or entry[0] != signature:
+        entry = (signature, parser(path))
+        memo[path] = entry
+    return entry[1]
+
+def remember_json(path, data):
+    """Record data just written to path so the next read is served from the memo"""
+    get_json_memo()[path] = (get_file_signature(path), data)
 
 # API Key Storage Functions
 CONFIG_FILE = ".dashboard_config.json"
+CONFIG_FILE_MODE = 0o600  # owner read/write only
+
+def restrict_config_permissions():
+    """Limit the config file to its owner; skipped on Windows, where POSIX modes do not apply"""
+    if os.name != 'nt':
+        # chmod can still fail on filesystems without POSIX permissions
+        with suppress(OSError):
+            os.chmod(CONFIG_FILE, CONFIG_FILE_MODE)
 
 def load_api_key():
     """Load saved API key from config file"""
-    try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                return config.get('openrouter_api_key', '')
-    except Exception:
-        pass
+    # A missing config file raises FileNotFoundError, which is suppressed like any other read failure
+    with suppress(Exception):
+        return read_json_memoized(CONFIG_FILE).get('openrouter_api_key', '')
     return ''
 
 def save_api_key(api_key):
     """Save API key to config file with secure permissions"""
     try:
-        config = {}
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-        
-        config['openrouter_api_key'] = api_key
-        
-        # Write the config file
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
-        
-        # Set restrictive permissions (owner read/write only)
         try:
-            os.chmod(CONFIG_FILE, stat.S_IRUSR | stat.S_IWUSR)  # 0600
-        except (OSError, AttributeError):
-            # chmod may fail on some platforms (e.g., Windows)
-            pass
+            config = dict(read_json_memoized(CONFIG_FILE))
+        except FileNotFoundError:
+            config = {}
+        
+        # Only touch the file when the stored key actually changes; this runs on every rerun
+        if config.get('openrouter_api_key') != api_key:
+            config['openrouter_api_key'] = api_key
+            
+            # Write the config file
+            write_json_file(CONFIG_FILE, config)
+            remember_json(CONFIG_FILE, config)
+            
+            # Set restrictive permissions (owner read/write only); Windows does not support POSIX modes
+            restrict_config_permissions()
         
         # Display security warning
         st.warning("⚠️ **Security Notice**: API key is stored in plain text in the config file. "
@@ -104,90 +187,137 @@ def save_api_key(api_key):
                   "environment variables for production deployments.")
         
     except Exception as e:
-        st.error(f"Failed to save API key: {str(e)}")
+        st.error(f"Failed to save API key: {e}")
 
 def clear_api_key():
     """Clear saved API key"""
-    try:
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-            
-            config.pop('openrouter_api_key', None)
-            
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
-            
-            # Maintain restrictive permissions
-            try:
-                os.chmod(CONFIG_FILE, stat.S_IRUSR | stat.S_IWUSR)  # 0600
-            except (OSError, AttributeError):
-                # chmod may fail on some platforms (e.g., Windows)
-                pass
-    except Exception:
-        pass
+    # Nothing to clear when the config file is missing; reading it then raises FileNotFoundError
+    with suppress(Exception):
+        config = dict(read_json_memoized(CONFIG_FILE))
+        
+        config.pop('openrouter_api_key', None)
+        
+        write_json_file(CONFIG_FILE, config)
+        remember_json(CONFIG_FILE, config)
+        
+        # Maintain restrictive permissions
+        restrict_config_permissions()
 
 # AI Cache Functions
 AI_CACHE_FILE = "ai_cache.json"
+# New and removed entries are appended here, then folded into AI_CACHE_FILE on compaction
+AI_CACHE_JOURNAL = "ai_cache.jsonl"
+JOURNAL_COMPACT_MIN = 64
+# Oldest summaries beyond this many are evicted whenever the cache is compacted
+MAX_AI_CACHE_ENTRIES = 500
+
+@st.cache_resource(show_spinner=False)
+def get_ai_cache_lock():
+    """Get the process-wide lock serializing AI cache reads and writes across sessions"""
+    # Reentrant because load_ai_cache compacts through save_ai_cache
+    return threading.RLock()
 
 def get_report_cache_key(report):
     """Generate a unique cache key for a report"""
-    # Use same logic as ReportAICache.get_cache_key for consistency
-    cache_data = {
-        "target": report.get("target", ""),
-        "scan_date": report.get("scan_date", ""),
-        "subdomains": sorted(report.get("subdomains", [])),
-        "open_ports": dict(sorted(report.get("open_ports", {}).items())),
-        "vulnerabilities": sorted([
-            {
-                "severity": v.get("severity", ""),
-                "title": v.get("title", ""),
-                "description": v.get("description", "")
-            }
-            for v in report.get("vulnerabilities", [])
-        ], key=lambda x: (x["severity"], x["title"]))
-    }
-    cache_string = json.dumps(cache_data, sort_keys=True)
-    return hashlib.md5(cache_string.encode()).hexdigest()
+    # Loaded reports carry the key computed at load time; it is shared with AIAnalyzer
+    # and ReportAICache so every cache agrees on it
+    return report.get('_cache_key') or compute_report_cache_key(report)
 
 def load_ai_cache():
-    """Load AI analysis cache from file"""
+    """Load AI analysis cache from the snapshot file and replay the journal over it"""
     try:
-        if os.path.exists(AI_CACHE_FILE):
-            with open(AI_CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        with get_ai_cache_lock():
+            return _load_ai_cache()
     except Exception as e:
-        st.error(f"Failed to load AI cache: {str(e)}")
+        st.error(f"Failed to load AI cache: {e}")
     return {}
 
+def _load_ai_cache():
+    """Replay the journal over the snapshot; callers hold the AI cache lock"""
+    # Callers add and remove entries, so hand out a copy of the memoized dict
+    try:
+        cache = dict(read_json_memoized(AI_CACHE_FILE))
+    except FileNotFoundError:
+        cache = {}
+    snapshot_size = len(cache)
+    
+    try:
+        records = read_json_memoized(AI_CACHE_JOURNAL, read_json_lines)
+    except FileNotFoundError:
+        records = []
+    
+    # Later records win; a None entry removes the key, and a rewritten key moves to the newest end
+    for record in records:
+        for cache_key, entry in record.items():
+            cache.pop(cache_key, None)
+            if entry is not None:
+                cache[cache_key] = entry
+    
+    # Compact once the journal outgrows the snapshot, so appends stay amortized O(1),
+    # or once the cache holds more entries than it may keep
+    if (len(records) >= JOURNAL_COMPACT_MIN and len(records) > snapshot_size) or len(cache) > MAX_AI_CACHE_ENTRIES:
+        save_ai_cache(cache)
+    return cache
+
 def save_ai_cache(cache):
-    """Save AI analysis cache to file"""
+    """Save the full AI analysis cache as a new snapshot and drop the journal"""
     try:
-        with open(AI_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
+        with get_ai_cache_lock():
+            trim_ai_cache(cache)
+            write_json_file(AI_CACHE_FILE, cache)
+            remember_json(AI_CACHE_FILE, cache)
+            with suppress(FileNotFoundError):
+                os.remove(AI_CACHE_JOURNAL)
+            get_json_memo().pop(AI_CACHE_JOURNAL, None)
     except Exception as e:
-        st.error(f"Failed to save AI cache: {str(e)}")
+        st.error(f"Failed to save AI cache: {e}")
+
+def trim_ai_cache(cache):
+    """Evict the oldest entries in place so at most MAX_AI_CACHE_ENTRIES remain"""
+    # Dicts keep insertion order, and load_ai_cache moves rewritten keys to the end
+    excess = len(cache) - MAX_AI_CACHE_ENTRIES
+    if excess > 0:
+        for cache_key in list(islice(cache, excess)):
+            del cache[cache_key]
+
+def journal_ai_cache_entry(cache_key, entry):
+    """Append a single cache entry, or a None removal marker, without rewriting the cache file"""
+    try:
+        # Without the lock, two sessions could each remember their own records plus one append and drop the other's
+        with get_ai_cache_lock():
+            try:
+                records = read_json_memoized(AI_CACHE_JOURNAL, read_json_lines)
+            except FileNotFoundError:
+                records = []
+            record = {cache_key: entry}
+            append_json_line(AI_CACHE_JOURNAL, record)
+            remember_json(AI_CACHE_JOURNAL, [*records, record])
+    except Exception as e:
+        st.error(f"Failed to save AI cache: {e}")
+
+def remove_cached_ai_summary(cache_key):
+    """Remove a cached AI summary if present"""
+    if cache_key in load_ai_cache():
+        journal_ai_cache_entry(cache_key, None)
 
-def get_cached_ai_summary(report):
+def get_cached_ai_summary(report, cache_key=None):
     """Get cached AI summary for a report"""
     cache = load_ai_cache()
-    cache_key = get_report_cache_key(report)
+    cache_key = cache_key or get_report_cache_key(report)
     cache_entry = cache.get(cache_key)
     if cache_entry and isinstance(cache_entry, dict):
         return cache_entry.get('summary')
     return None
 
-def cache_ai_summary(report, summary):
+def cache_ai_summary(report, summary, cache_key=None):
     """Cache AI summary for a report"""
-    cache = load_ai_cache()
-    cache_key = get_report_cache_key(report)
-    cache[cache_key] = {
+    cache_key = cache_key or get_report_cache_key(report)
+    journal_ai_cache_entry(cache_key, {
         'summary': summary,
         'target': report.get('target', 'unknown'),
         'timestamp': datetime.now().isoformat(),
         'cache_key': cache_key
-    }
-    save_ai_cache(cache)
+    })
 
 # Page configuration
 st.set_page_config(
@@ -207,6 +337,13 @@ st.markdown("""
         text-align: center;
         margin-bottom: 1rem;
     }
+    .kpi-row {
+        display: flex;
+        gap: 1rem;
+    }
+    .kpi-row .kpi-card {
+        flex: 1;
+    }
     .kpi-card {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
         color: white;
@@ -239,19 +376,49 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+# Report Loading Functions
+REPORTS_DIR = "reports"
+
+def get_reports_signature(reports_dir):
+    """Build a cheap (filename, size, mtime) signature of the JSON files in a directory"""
+    signature = []
+    try:
+        with os.scandir(reports_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith('.json'):
+                    file_stat = entry.stat()
+                    signature.append((entry.name, file_stat.st_size, file_stat.st_mtime_ns))
+    except OSError:
+        pass
+    return tuple(sorted(signature))
+
+def get_report_display_key(report):
+    """Digest of every field a report was loaded with, so any edit that could change the views changes the key"""
+    content = {key: value for key, value in report.items() if not key.startswith('_')}
+    return hashlib.blake2b(json.dumps(content, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _load_reports_cached(reports_dir, signature):
+    """Parse reports from disk; the signature invalidates the cache when any file changes"""
+    # max_entries=1 drops the previous parse instead of keeping a full copy per directory version
+    loader = ReportLoader()
+    reports = loader.load_reports(reports_dir)
+    # Hash each report's content once per load rather than on every rerun that needs its key
+    for report in reports:
+        report['_display_key'] = get_report_display_key(report)
+        report['_cache_key'] = compute_report_cache_key(report)
+    return reports, list(loader.errors)
+
 def load_reports_cached():
     """Load reports with caching"""
     try:
-        loader = ReportLoader()
-        reports = loader.load_reports("reports")
+        reports, errors = _load_reports_cached(REPORTS_DIR, get_reports_signature(REPORTS_DIR))
         
         # Display any loading errors
-        if hasattr(loader, 'errors') and loader.errors:
+        if errors:
             with st.expander("⚠️ Report Loading Issues", expanded=True):
-                st.error("**Issues found while loading reports:**")
-                for error in loader.errors:
-                    st.error(f"• {error}")
+                # One element for all issues instead of one per failed file
+                st.error("**Issues found while loading reports:**\n" + "\n".join(f"- {error}" for error in errors))
                 st.info("💡 **Tip:** Valid reports will still be displayed below. Please fix the problematic files and refresh the page.")
                 
                 # Add helpful guidance
@@ -263,21 +430,321 @@ def load_reports_cached():
                 """)
                 
                 if st.button("🔄 Refresh Reports", key="refresh_after_error"):
-                    st.cache_data.clear()
+                    _load_reports_cached.clear()
                     st.rerun()
         
         return reports
     except Exception as e:
-        st.error(f"Error loading reports: {str(e)}")
+        st.error(f"Error loading reports: {e}")
         return []
 
+# Streamlit Compatibility
+# Fragments rerun on their own when their widgets change; Streamlit releases without them run the body inline
+st_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# Shared Resources
+@st.cache_resource(show_spinner=False)
+def get_analytics():
+    """Get the process-wide ReportAnalytics instance"""
+    return ReportAnalytics()
+
+@st.cache_resource(show_spinner=False)
+def get_ai_analyzer(api_key):
+    """Get a process-wide AIAnalyzer per API key so its HTTP session is reused"""
+    return AIAnalyzer(api_key=api_key)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _validate_api_key_cached(key_fingerprint, _analyzer):
+    """Probe the API key with OpenRouter at most once per key every five minutes"""
+    # Streamlit does not cache exceptions, so a failure (possibly a network blip) is re-checked next time
+    if not _analyzer.validate_api_key():
+        raise ValueError("API key validation failed")
+    return True
+
+def validate_api_key_cached(api_key, analyzer):
+    """Validate an API key, reusing only successful results"""
+    try:
+        return _validate_api_key_cached(get_api_key_fingerprint(api_key), analyzer)
+    except ValueError:
+        return False
+
+def get_api_key_fingerprint(api_key):
+    """Short digest identifying an API key without keeping the key itself in the cache"""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+# Display Settings
+MAX_PIE_PORTS = 8
+MAX_BAR_TARGETS = 20
+PAGE_SIZE_OPTIONS = [25, 50, 100]
+MAX_TARGET_OPTIONS = 100
+HIGH_RISK_PORTS = frozenset(['22', '3389', '1433', '3306'])
+MEDIUM_RISK_PORTS = frozenset(['21', '23', '25'])
+PORT_RISK_COLORS = {'High': '#ff4444', 'Medium': '#ffaa00', 'Low': '#44ff44'}
+PORT_RISK_ICONS = {'High': '🔴', 'Medium': '🟡', 'Low': '🟢'}
+SEVERITY_ICONS = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🟢'}
+EXPANDED_SEVERITIES = frozenset(['critical', 'high'])
+# Risk level from the average severity score; thresholds are inclusive lower bounds
+SEVERITY_SCORES = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
+RISK_THRESHOLDS = (1.5, 2.5, 3.5)
+RISK_LABELS = ("🟢 Low", "🟡 Medium", "🟠 High", "🔴 Critical")
+
+VULNERABILITY_TEMPLATE = "**{v.title}**  \n**Description:** {v.description}  \n**Affected Service:** {v.service}  \n{cve}"
+KPI_CARD_TEMPLATE = '<div class="kpi-card"><div class="kpi-number">{value}</div><div class="kpi-label">{label}</div></div>'
+NO_CVE_LINE = "💡 No CVE ID assigned to this vulnerability"
+# Research links for a CVE: compact for table cells, labelled for detail views, one per line for the sidebar
+CVE_TEMPLATE = (
+    "[NVD](https://nvd.nist.gov/vuln/detail/{c}) • "
+    "[Details](https://www.cvedetails.com/cve/{c}/) • "
+    "[MITRE](https://cve.mitre.org/cgi-bin/cvename.cgi?name={c})"
+)
+CVE_LINKS_TEMPLATE = (
+    "**🔗 CVE Research Links:** "
+    "🏛️ [NIST NVD](https://nvd.nist.gov/vuln/detail/{c}) • "
+    "📊 [CVE Details](https://www.cvedetails.com/cve/{c}/) • "
+    "🎯 [MITRE](https://cve.mitre.org/cgi-bin/cvename.cgi?name={c}) • "
+    "🔍 [Exploit-DB](https://www.exploit-db.com/search?cve={c})"
+)
+CVE_RESEARCH_TEMPLATE = (
+    "**🔗 Research Links:**  \n"
+    "🏛️ [NIST NVD](https://nvd.nist.gov/vuln/detail/{c})  \n"
+    "📊 [CVE Details](https://www.cvedetails.com/cve/{c}/)  \n"
+    "🎯 [MITRE](https://cve.mitre.org/cgi-bin/cvename.cgi?name={c})  \n"
+    "🔍 [Exploit-DB](https://www.exploit-db.com/search?cve={c})"
+)
+REPORT_SECTIONS = ["🌐 Subdomains", "🔌 Open Ports", "🚨 Vulnerabilities", "🤖 AI Analysis"]
+
+# Markdown Helpers
+def escape_table_cell(value):
+    """Escape pipes and fold line breaks so report text cannot split a markdown table row"""
+    return " ".join(str(value).replace("|", "\\|").split())
+
+# Analytics Caching Functions
+# Each distinct selection of reports gets its own entry; the least recently used ones are dropped past this
+MAX_SELECTION_CACHE_ENTRIES = 32
+
+def get_reports_fingerprint(reports):
+    """Build a lightweight, hashable fingerprint of a list of reports from their load-time display keys"""
+    # The AI cache key only covers the fields sent to the model, so edits to fields such as
+    # CVE IDs or affected services would leave the aggregate caches stale
+    return tuple(r['_display_key'] for r in reports)
+
+# The leading underscore keeps Streamlit from hashing the reports; the fingerprint is the key
+@st.cache_data(show_spinner=False, max_entries=MAX_SELECTION_CACHE_ENTRIES)
+def _cached_aggregates(fingerprint, _reports):
+    """Calculate KPIs, chart data and severity totals together, stored as one cache entry per distinct set of reports"""
+    aggregates = get_analytics().calculate_overview(_reports)
+    
+    # Severity totals come from the per-report groups built at load time
+    severity_counts = dict.fromkeys(SEVERITY_ICONS, 0)
+    for report in _reports:
+        for severity, vulns in report['_vulnerabilities_by_severity'].items():
+            severity_counts[severity] += len(vulns)
+    aggregates['severity_counts'] = severity_counts
+    return aggregates
+
+@st.cache_data(show_spinner=False, max_entries=MAX_SELECTION_CACHE_ENTRIES)
+def _build_comparison_rows(fingerprint, _reports):
+    """Build the multi-report comparison table as parallel columns once per distinct set of reports"""
+    targets = []
+    scan_dates = []
+    sub_counts = []
+    port_counts = []
+    vuln_counts = []
+    risk_levels = []
+    for report in _reports:
+        targets.append(report.get('target', 'Unknown'))
+        scan_dates.append(report.get('scan_date', 'Unknown'))
+        sub_counts.append(len(report.get('subdomains', [])))
+        port_counts.append(len(report.get('open_ports', {})))
+        vuln_counts.append(len(report.get('vulnerabilities', [])))
+        risk_levels.append(calculate_risk_level(report))
+    return {
+        'Target': targets,
+        'Scan Date': scan_dates,
+        'Subdomains': sub_counts,
+        'Open Ports': port_counts,
+        'Vulnerabilities': vuln_counts,
+        'Risk Level': risk_levels
+    }
+
+@st.cache_data(show_spinner=False, max_entries=MAX_SELECTION_CACHE_ENTRIES)
+def _build_port_rows(port_items):
+    """Build the open ports table as parallel columns sorted by port number, once per port set"""
+    # Non-numeric ports sort after every numeric one
+    rows = sorted((int(p) if p.isdigit() else 10**9, p, s) for p, s in port_items)
+    ports = []
+    services = []
+    risks = []
+    for _, port, service in rows:
+        ports.append(port)
+        services.append(service or 'Unknown')
+        risks.append('High' if port in HIGH_RISK_PORTS else 'Medium' if port in MEDIUM_RISK_PORTS else 'Low')
+    return ports, services, risks
+
+@st.cache_data(show_spinner=False, max_entries=MAX_SELECTION_CACHE_ENTRIES)
+def _build_ports_markdown(port_items):
+    """Build the open ports markdown table as one string, once per port set"""
+    ports, services, risks = _build_port_rows(port_items)
+    lines = ["| Port | Service | Risk Level |", "|------|---------|------------|"]
+    for port, service, risk in zip(ports, services, risks):
+        lines.append(f"| {escape_table_cell(port)} | {escape_table_cell(service)} | {PORT_RISK_ICONS[risk]} {risk} |")
+    return "\n".join(lines)
+
+@st.cache_data(show_spinner=False, max_entries=MAX_SELECTION_CACHE_ENTRIES)
+def _build_report_index(fingerprint, _reports):
+    """Build sidebar option labels, unique target names and a label-to-position lookup in a single pass"""
+    report_options = []
+    all_targets = []
+    label_index = {}
+    for i, r in enumerate(_reports):
+        target = r.get('target', 'Unknown')
+        label = f"{target} ({r.get('scan_date', 'Unknown')})"
+        # Repeated target/date pairs get a suffix so every report keeps its own option
+        if label in label_index:
+            label = f"{label} [{i + 1}]"
+        report_options.append(label)
+        label_index[label] = i
+        all_targets.append(target)
+    # Repeated scans of a target share one multiselect option, so the option cap and counts are per target
+    return report_options, list(dict.fromkeys(all_targets)), label_index
+
+@st.cache_data(show_spinner=False, max_entries=MAX_SELECTION_CACHE_ENTRIES)
+def _group_cves_by_severity(fingerprint, _reports):
+    """Collect each distinct CVE once as (cve_id, title, targets) per severity, once per distinct set of reports"""
+    # A CVE found in several reports is listed once under the most severe rating it was given
+    severity_rank = {severity: rank for rank, severity in enumerate(SEVERITY_ICONS)}
+    seen = {}
+    for report in _reports:
+        target = report.get('target', 'Unknown')
+        for severity, vulns in report['_vulnerabilities_by_severity'].items():
+            for vuln in vulns:
+                if not vuln.cve_id:
+                    continue
+                cve_id = str(vuln.cve_id)
+                entry = seen.get(cve_id)
+                if entry is None:
+                    seen[cve_id] = [severity, vuln.title, {target: None}]
+                else:
+                    if severity_rank[severity] < severity_rank[entry[0]]:
+                        entry[0] = severity
+                    entry[2][target] = None
+    
+    cve_by_severity = {severity: [] for severity in SEVERITY_ICONS}
+    for cve_id, (severity, title, targets) in seen.items():
+        cve_by_severity[severity].append((cve_id, title, ", ".join(targets)))
+    return cve_by_severity
+
+# Chart Builders
+# Figures are cached per data set so reruns skip rebuilding them, and uirevision
+# lets the browser keep zoom and hover state when the same figure is redrawn.
+# Plotly is imported on first use to keep cold start light.
+@st.cache_data(show_spinner=False, max_entries=MAX_SELECTION_CACHE_ENTRIES)
+def _build_ports_figure(port_items):
+    """Build the interactive open ports table figure, once per port set"""
+    import plotly.graph_objects as go
+    
+    ports, services, risks = _build_port_rows(port_items)
+    
+    # Color code the risk levels
+    colors = [PORT_RISK_COLORS[risk] for risk in risks]
+    
+    fig = go.Figure(data=[go.Table(
+        header=dict(
+            values=['Port', 'Service', 'Risk Level'],
+            fill_color='lightblue',
+            align='left',
+            font=dict(size=14, color='black'),
+            line_color='darkslategray',
+            line_width=1
+        ),
+        cells=dict(
+            values=[ports, services, risks],
+            fill_color=[['white']*len(ports), ['white']*len(ports), colors],
+            align='left',
+            font=dict(size=12),
+            line_color='darkslategray',
+            line_width=1,
+            height=30
+        )
+    )])
+    
+    fig.update_layout(
+        title="Interactive Port Analysis - Hover for Details",
+        height=max(300, len(ports) * 35 + 100),
+        margin=dict(l=0, r=0, t=50, b=0),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Arial"
+        ),
+        uirevision='ports'
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=MAX_SELECTION_CACHE_ENTRIES)
+def _build_subdomain_figure(fingerprint, _subdomain_counts):
+    """Build the subdomains-per-target bar chart, once per distinct set of reports"""
+    import plotly.graph_objects as go
+    
+    # Past the cap, only the targets with the most subdomains are drawn so the chart stays readable
+    top_targets = list(_subdomain_counts.items())
+    if len(top_targets) > MAX_BAR_TARGETS:
+        top_targets = heapq.nlargest(MAX_BAR_TARGETS, top_targets, key=itemgetter(1))
+    
+    fig = go.Figure(go.Bar(
+        x=[target for target, _ in top_targets],
+        y=[count for _, count in top_targets],
+        hovertemplate="<b>%{x}</b><br>Subdomains: %{y}<extra></extra>"
+    ))
+    fig.update_layout(
+        title=(
+            "Subdomains Found per Target" if len(top_targets) == len(_subdomain_counts)
+            else f"Subdomains Found per Target (top {MAX_BAR_TARGETS})"
+        ),
+        xaxis_title="Target",
+        yaxis_title="Subdomains",
+        showlegend=False,
+        hovermode='closest',
+        uirevision='subdomains'
+    )
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=MAX_SELECTION_CACHE_ENTRIES)
+def _build_port_distribution_figure(fingerprint, _port_distribution):
+    """Build the most common ports pie chart, once per distinct set of reports"""
+    import plotly.graph_objects as go
+    
+    # Keep the most common ports and fold the rest into "Other"
+    ports = np.array(list(_port_distribution.keys()))
+    counts = np.array(list(_port_distribution.values()))
+    order = np.argsort(-counts, kind='stable')
+    top = order[:MAX_PIE_PORTS]
+    labels = [f"Port {p}" for p in ports[top]]
+    values = counts[top].tolist()
+    other_count = int(counts[order[MAX_PIE_PORTS:]].sum())
+    if other_count:
+        labels.append("Other")
+        values.append(other_count)
+    
+    fig = go.Figure(go.Pie(
+        values=values,
+        labels=labels,
+        hovertemplate="<b>%{label}</b><br>Occurrences: %{value}<br>Percentage: %{percent}<extra></extra>"
+    ))
+    fig.update_layout(
+        title="Most Common Open Ports",
+        hovermode='closest',
+        uirevision='port_distribution'
+    )
+    return fig
+
 def initialize_components():
     """Initialize all components"""
     if 'analytics' not in st.session_state:
-        st.session_state.analytics = ReportAnalytics()
+        st.session_state.analytics = get_analytics()
     if 'ai_analyzer' not in st.session_state:
         try:
-            st.session_state.ai_analyzer = AIAnalyzer()
+            st.session_state.ai_analyzer = get_ai_analyzer(os.getenv('OPENROUTER_API_KEY'))
         except Exception:
             st.session_state.ai_analyzer = type('DummyAI', (), {
                 'is_enabled': lambda: False,
@@ -286,52 +753,31 @@ def initialize_components():
                 'check_api_key_format': lambda: (False, "AI analyzer not available")
             })()
 
-def render_kpi_cards(reports):
+def render_kpi_cards(reports, aggregates):
     """Render clean KPI cards"""
     if not reports:
         st.info("📊 No data available - add reports to see KPIs")
         return
     
-    analytics = st.session_state.analytics
-    kpis = analytics.calculate_kpis(reports)
+    kpis = aggregates['kpis']
     
     st.markdown("### 📊 Overview")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="kpi-card">
-            <div class="kpi-number">{kpis.get('total_reports', 0)}</div>
-            <div class="kpi-label">Reports Analyzed</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="kpi-card">
-            <div class="kpi-number">{kpis.get('total_subdomains', 0)}</div>
-            <div class="kpi-label">Unique Subdomains</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        avg_ports = kpis.get('avg_open_ports', 0)
-        st.markdown(f"""
-        <div class="kpi-card">
-            <div class="kpi-number">{avg_ports:.1f}</div>
-            <div class="kpi-label">Avg Open Ports</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="kpi-card">
-            <div class="kpi-number">{kpis.get('total_vulnerabilities', 0)}</div>
-            <div class="kpi-label">Total Vulnerabilities</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # All four cards go out as one HTML element laid out by the .kpi-row flexbox
+    cards = (
+        (kpis.get('total_reports', 0), "Reports Analyzed"),
+        (kpis.get('total_subdomains', 0), "Unique Subdomains"),
+        (f"{kpis.get('avg_open_ports', 0):.1f}", "Avg Open Ports"),
+        (kpis.get('total_vulnerabilities', 0), "Total Vulnerabilities")
+    )
+    st.markdown(
+        '<div class="kpi-row">'
+        + "".join(KPI_CARD_TEMPLATE.format(value=value, label=label) for value, label in cards)
+        + '</div>',
+        unsafe_allow_html=True
+    )
 
+@st_fragment
 def render_single_report_view(report):
     """Render detailed view for a single report"""
     target = report.get('target', 'Unknown')
@@ -349,149 +795,87 @@ def render_single_report_view(report):
     with col3:
         st.metric("Vulnerabilities", len(report.get('vulnerabilities', [])))
     
-    # Tabs for organized content
-    tab1, tab2, tab3, tab4 = st.tabs(["🌐 Subdomains", "🔌 Open Ports", "🚨 Vulnerabilities", "🤖 AI Analysis"])
+    # Section picker for organized content; unlike st.tabs, only the chosen section is built each rerun
+    section = st.radio(
+        "Section",
+        REPORT_SECTIONS,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="report_section"
+    )
     
-    with tab1:
+    if section == "🌐 Subdomains":
         subdomains = report.get('subdomains', [])
         if subdomains:
             st.write(f"**Found {len(subdomains)} subdomains:**")
             
-            # Display in columns for better readability
+            # Display in columns for better readability, one markdown element per column
             cols = st.columns(3)
-            for i, subdomain in enumerate(subdomains):
-                with cols[i % 3]:
-                    st.write(f"• {subdomain}")
+            for i, col in enumerate(cols):
+                column_subdomains = subdomains[i::3]
+                if column_subdomains:
+                    col.markdown("  \n".join(f"• {subdomain}" for subdomain in column_subdomains))
         else:
             st.info("No subdomains found")
     
-    with tab2:
+    elif section == "🔌 Open Ports":
         open_ports = report.get('open_ports', {})
         if open_ports:
             st.write(f"**Found {len(open_ports)} open ports:**")
             
             # Create a clean table
-            port_data = []
-            for port, service in open_ports.items():
-                port_data.append({
-                    'Port': port,
-                    'Service': service or 'Unknown',
-                    'Risk': 'High' if port in ['22', '3389', '1433', '3306'] else 'Medium' if port in ['21', '23', '25'] else 'Low'
-                })
+            port_items = tuple(open_ports.items())
+            ports, services, risks = _build_port_rows(port_items)
             
-            if port_data:
+            if ports:
                 # Option 1: Interactive Plotly table (PyArrow alternative)
                 use_interactive_tables = st.checkbox("Use Interactive Tables", value=False, key="interactive_ports")
                 
                 if use_interactive_tables:
-                    # Advanced interactive table with sorting, filtering
-                    import plotly.graph_objects as go
-                    
-                    # Color code the risk levels
-                    colors = []
-                    for item in port_data:
-                        if item['Risk'] == 'High':
-                            colors.append('#ff4444')  # Red
-                        elif item['Risk'] == 'Medium':
-                            colors.append('#ffaa00')  # Orange
-                        else:
-                            colors.append('#44ff44')  # Green
-                    
-                    fig = go.Figure(data=[go.Table(
-                        header=dict(
-                            values=['Port', 'Service', 'Risk Level'],
-                            fill_color='lightblue',
-                            align='left',
-                            font=dict(size=14, color='black'),
-                            line_color='darkslategray',
-                            line_width=1
-                        ),
-                        cells=dict(
-                            values=[
-                                [item['Port'] for item in port_data],
-                                [item['Service'] for item in port_data],
-                                [f"{item['Risk']}" for item in port_data]
-                            ],
-                            fill_color=[['white']*len(port_data), ['white']*len(port_data), colors],
-                            align='left',
-                            font=dict(size=12),
-                            line_color='darkslategray',
-                            line_width=1,
-                            height=30
-                        )
-                    )])
-                    
-                    fig.update_layout(
-                        title="Interactive Port Analysis - Hover for Details",
-                        height=max(300, len(port_data) * 35 + 100),
-                        margin=dict(l=0, r=0, t=50, b=0),
-                        hoverlabel=dict(
-                            bgcolor="white",
-                            font_size=12,
-                            font_family="Arial"
-                        )
-                    )
+                    # Advanced interactive table with sorting, filtering; built once per port set
+                    fig = _build_ports_figure(port_items)
                     
                     st.plotly_chart(fig, use_container_width=True)
                 else:
-                    # Option 2: Clean markdown table (current approach)
-                    st.markdown("| Port | Service | Risk Level |")
-                    st.markdown("|------|---------|------------|")
-                    for port_info in port_data:
-                        risk_color = "🔴" if port_info['Risk'] == 'High' else "🟡" if port_info['Risk'] == 'Medium' else "🟢"
-                        st.markdown(f"| {port_info['Port']} | {port_info['Service']} | {risk_color} {port_info['Risk']} |")
+                    # Option 2: Clean markdown table, prebuilt and sent as a single element
+                    st.markdown(_build_ports_markdown(port_items))
         else:
             st.info("No open ports found")
     
-    with tab3:
+    elif section == "🚨 Vulnerabilities":
         vulnerabilities = report.get('vulnerabilities', [])
         if vulnerabilities:
             st.write(f"**Found {len(vulnerabilities)} vulnerabilities:**")
             
-            # Group by severity
-            severity_groups = {'critical': [], 'high': [], 'medium': [], 'low': []}
-            for vuln in vulnerabilities:
-                severity = vuln.get('severity', 'low').lower()
-                if severity in severity_groups:
-                    severity_groups[severity].append(vuln)
-                else:
-                    severity_groups['low'].append(vuln)
-            
-            # Display by severity
-            for severity, vulns in severity_groups.items():
+            # Vulnerabilities were normalized and grouped at load time, so the render loop needs no coercion;
+            # display by severity, one expander and one markdown element per severity group
+            for severity, vulns in report['_vulnerabilities_by_severity'].items():
                 if vulns:
-                    severity_icons = {
-                        'critical': '🔴',
-                        'high': '🟠',
-                        'medium': '🟡',
-                        'low': '🟢'
-                    }
-                    
-                    st.markdown(f"**{severity_icons[severity]} {severity.title()} Severity ({len(vulns)})**")
+                    # Enhanced CVE display with research links
+                    parts = [
+                        VULNERABILITY_TEMPLATE.format(
+                            v=vuln,
+                            cve=f"**CVE ID:** `{vuln.cve_id}`  \n{format_cve_links(vuln.cve_id)}" if vuln.cve_id else NO_CVE_LINE
+                        )
+                        for vuln in vulns
+                    ]
                     
-                    for vuln in vulns:
-                        with st.expander(f"{vuln.get('title', 'Unknown Vulnerability')}", expanded=False):
-                            st.write(f"**Description:** {vuln.get('description', 'No description available')}")
-                            st.write(f"**Affected Service:** {vuln.get('affected_service', 'Unknown')}")
-                            
-                            # Enhanced CVE display with research links
-                            if vuln.get('cve_id'):
-                                cve_id = vuln.get('cve_id')
-                                st.write(f"**CVE ID:** `{cve_id}`")
-                                
-                                # Use the enhanced CVE linking function
-                                render_cve_links(cve_id)
-                            else:
-                                st.info("💡 No CVE ID assigned to this vulnerability")
+                    with st.expander(
+                        f"{SEVERITY_ICONS[severity]} {severity.title()} Severity ({len(vulns)})",
+                        expanded=severity in EXPANDED_SEVERITIES
+                    ):
+                        st.markdown("\n\n---\n\n".join(parts))
         else:
             st.info("No vulnerabilities found")
     
-    with tab4:
+    else:
         render_ai_analysis(report)
 
 def render_ai_analysis(report):
     """Render AI analysis section"""
-    if not st.session_state.ai_analyzer.is_enabled():
+    # Resolve the analyzer once instead of going through the session state proxy per use
+    analyzer = st.session_state.ai_analyzer
+    if not analyzer.is_enabled():
         st.warning("⚠️ AI analysis not available")
         st.info("""
         **To enable AI analysis:**
@@ -501,9 +885,11 @@ def render_ai_analysis(report):
         """)
         return
     
-    # Check for existing summary (from cache or report)
-    cached_summary = get_cached_ai_summary(report)
-    existing_summary = report.get('ai_summary') or cached_summary
+    # Serialize and hash the report once per render; every cache operation below reuses the key
+    cache_key = get_report_cache_key(report)
+    
+    # Check for existing summary; the cache file is only read when the report has none of its own
+    existing_summary = report.get('ai_summary') or get_cached_ai_summary(report, cache_key)
     
     if existing_summary:
         st.success("✅ AI Analysis Available")
@@ -516,59 +902,46 @@ def render_ai_analysis(report):
                 with st.spinner("Regenerating AI analysis..."):
                     try:
                         # Clear existing cache first
-                        cache = load_ai_cache()
-                        cache_key = get_report_cache_key(report)
-                        if cache_key in cache:
-                            del cache[cache_key]
-                            save_ai_cache(cache)
+                        remove_cached_ai_summary(cache_key)
                         
-                        # Generate new summary
-                        summary = st.session_state.ai_analyzer.generate_summary(report)
+                        # Generate new summary; the shared analyzer would otherwise hand back its in-memory copy
+                        summary = analyzer.generate_summary(report, use_cache=False)
                         if summary and summary.strip():
-                            cache_ai_summary(report, summary)
+                            cache_ai_summary(report, summary, cache_key)
                             st.success("✅ Analysis regenerated!")
                             st.rerun()
                         else:
                             st.error("❌ Failed to generate analysis - empty response")
                     except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
+                        st.error(f"❌ Error: {e}")
         
         with col2:
             if st.button("🗑️ Clear Analysis", key=f"clear_{report.get('target', 'unknown')}"):
                 # Remove from cache
-                cache = load_ai_cache()
-                cache_key = get_report_cache_key(report)
-                if cache_key in cache:
-                    del cache[cache_key]
-                    save_ai_cache(cache)
+                remove_cached_ai_summary(cache_key)
                 st.success("✅ Analysis cleared!")
                 st.rerun()
     else:
         st.info("💡 No AI analysis yet")
-        # Check if AI is properly configured
-        if not hasattr(st.session_state, 'ai_analyzer') or not st.session_state.ai_analyzer.is_enabled():
-            st.warning("⚠️ AI analysis requires a valid API key. Please configure it in the sidebar.")
-            return
         
         if st.button("🧠 Generate AI Analysis", key=f"gen_{report.get('target', 'unknown')}"):
             with st.spinner("Generating AI threat analysis..."):
                 try:
                     # Store debug info
-                    if 'ai_debug' not in st.session_state:
-                        st.session_state.ai_debug = {}
+                    ai_debug = st.session_state.setdefault('ai_debug', {})
                     
-                    st.session_state.ai_debug['last_attempt'] = f"Generating for {report.get('target', 'unknown')}"
+                    ai_debug['last_attempt'] = f"Generating for {report.get('target', 'unknown')}"
                     
-                    summary = st.session_state.ai_analyzer.generate_summary(report)
+                    summary = analyzer.generate_summary(report, use_cache=False)
                     
                     if summary and summary.strip():
                         # Cache the summary
-                        cache_ai_summary(report, summary)
-                        st.session_state.ai_debug['last_result'] = "Success - Cached"
+                        cache_ai_summary(report, summary, cache_key)
+                        ai_debug['last_result'] = "Success - Cached"
                         st.success("✅ Analysis generated and cached!")
                         st.rerun()
                     else:
-                        st.session_state.ai_debug['last_result'] = "Empty summary returned"
+                        ai_debug['last_result'] = "Empty summary returned"
                         st.error("❌ Failed to generate analysis - empty response")
                         st.info("""
                         **Possible causes:**
@@ -584,16 +957,20 @@ def render_ai_analysis(report):
                         """)
                         
                 except Exception as e:
-                    st.session_state.ai_debug['last_error'] = str(e)
-                    st.error(f"❌ Error: {str(e)}")
+                    ai_debug['last_error'] = str(e)
+                    st.error(f"❌ Error: {e}")
         
         # Show AI debug info
         if 'ai_debug' in st.session_state:
-            with st.expander("🔍 AI Debug Info"):
-                for key, value in st.session_state.ai_debug.items():
-                    st.write(f"{key}: {value}")
+            render_debug_info(st, "🔍 AI Debug Info", st.session_state.ai_debug)
+
+def render_debug_info(container, title, debug_info):
+    """Render debug key/value pairs inside a collapsed expander as a single markdown element"""
+    with container.expander(title):
+        st.markdown("  \n".join(f"{key}: {value}" for key, value in debug_info.items()))
 
-def render_multi_report_view(reports):
+@st_fragment
+def render_multi_report_view(reports, fingerprint, aggregates):
     """Render comparison view for multiple reports"""
     st.markdown("## 📊 Multi-Report Analysis")
     st.info(f"Analyzing {len(reports)} reports together")
@@ -601,71 +978,41 @@ def render_multi_report_view(reports):
     # Comparison table
     st.markdown("### 📋 Report Comparison")
     
-    comparison_data = []
-    for report in reports:
-        comparison_data.append({
-            'Target': report.get('target', 'Unknown'),
-            'Scan Date': report.get('scan_date', 'Unknown'),
-            'Subdomains': len(report.get('subdomains', [])),
-            'Open Ports': len(report.get('open_ports', {})),
-            'Vulnerabilities': len(report.get('vulnerabilities', [])),
-            'Risk Level': calculate_risk_level(report)
-        })
+    comparison_data = _build_comparison_rows(fingerprint, reports)
     
     # Display comparison table without PyArrow
-    st.markdown("| Target | Scan Date | Subdomains | Open Ports | Vulnerabilities | Risk Level |")
-    st.markdown("|--------|-----------|------------|------------|-----------------|------------|")
-    for data in comparison_data:
-        st.markdown(f"| {data['Target']} | {data['Scan Date']} | {data['Subdomains']} | {data['Open Ports']} | {data['Vulnerabilities']} | {data['Risk Level']} |")
-    
-    # Charts for comparison
+    # Emit the whole table as one markdown element instead of one per row
+    comparison_rows = [
+        f"| {escape_table_cell(target)} | {escape_table_cell(scan_date)} | {subs} | {ports} | {vulns} | {risk} |"
+        for target, scan_date, subs, ports, vulns, risk in zip(*comparison_data.values())
+    ]
+    st.markdown("\n".join([
+        "| Target | Scan Date | Subdomains | Open Ports | Vulnerabilities | Risk Level |",
+        "|--------|-----------|------------|------------|-----------------|------------|",
+        *comparison_rows
+    ]))
+    
+    # Charts for comparison, built once per distinct set of reports
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("### 📊 Subdomains by Target")
-        analytics = st.session_state.analytics
-        subdomain_counts = analytics.get_subdomain_counts(reports)
+        subdomain_counts = aggregates['subdomain_counts']
         
         if subdomain_counts:
             try:
-                fig = px.bar(
-                    x=list(subdomain_counts.keys()),
-                    y=list(subdomain_counts.values()),
-                    title="Subdomains Found per Target",
-                    labels={'x': 'Target', 'y': 'Subdomains'},
-                    hover_data={'x': True, 'y': True}
-                )
-                fig.update_layout(
-                    showlegend=False,
-                    hovermode='closest'
-                )
-                fig.update_traces(
-                    hovertemplate="<b>%{x}</b><br>Subdomains: %{y}<extra></extra>"
-                )
+                fig = _build_subdomain_figure(fingerprint, subdomain_counts)
                 st.plotly_chart(fig, use_container_width=True, key="subdomain_chart")
             except Exception:
                 st.bar_chart(subdomain_counts)
     
     with col2:
         st.markdown("### 🔌 Port Distribution")
-        port_distribution = analytics.get_port_distribution(reports)
+        port_distribution = aggregates['port_distribution']
         
         if port_distribution:
             try:
-                # Get top 8 ports
-                top_ports = dict(list(port_distribution.items())[:8])
-                fig = px.pie(
-                    values=list(top_ports.values()),
-                    names=[f"Port {p}" for p in top_ports.keys()],
-                    title="Most Common Open Ports",
-                    hover_data=['values']
-                )
-                fig.update_traces(
-                    hovertemplate="<b>Port %{label}</b><br>Occurrences: %{value}<br>Percentage: %{percent}<extra></extra>"
-                )
-                fig.update_layout(
-                    hovermode='closest'
-                )
+                fig = _build_port_distribution_figure(fingerprint, port_distribution)
                 st.plotly_chart(fig, use_container_width=True, key="port_chart")
             except Exception:
                 st.write("**Top Ports:**")
@@ -675,24 +1022,9 @@ def render_multi_report_view(reports):
     # Vulnerability summary
     st.markdown("### 🚨 Vulnerability Summary")
     
-    all_vulns = []
-    for report in reports:
-        vulns = report.get('vulnerabilities', [])
-        for vuln in vulns:
-            vuln_copy = vuln.copy()
-            vuln_copy['target'] = report.get('target', 'Unknown')
-            all_vulns.append(vuln_copy)
-    
-    if all_vulns:
-        # Group by severity
-        severity_counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
-        for vuln in all_vulns:
-            severity = vuln.get('severity', 'low').lower()
-            if severity in severity_counts:
-                severity_counts[severity] += 1
-            else:
-                severity_counts['low'] += 1
-        
+    severity_counts = aggregates['severity_counts']
+    
+    if any(severity_counts.values()):
         col1, col2, col3, col4 = st.columns(4)
         with col1:
             st.metric("🔴 Critical", severity_counts['critical'])
@@ -705,74 +1037,129 @@ def render_multi_report_view(reports):
         
         # Show top vulnerabilities
         if st.checkbox("Show detailed vulnerabilities"):
+            # Flatten only when the table is shown
+            all_vulns = [
+                (report.get('target', 'Unknown'), vuln)
+                for report in reports
+                for vuln in report['_vulnerabilities']
+            ]
+            
+            # Paginate so only one page of rows is sent to the browser per rerun
+            page_col, size_col = st.columns(2)
+            with size_col:
+                page_size = st.selectbox("Rows per page", PAGE_SIZE_OPTIONS, index=1, key="vuln_page_size")
+            total_pages = max(1, math.ceil(len(all_vulns) / page_size))
+            if st.session_state.get("vuln_page", 1) > total_pages:
+                st.session_state.vuln_page = total_pages
+            with page_col:
+                page = st.number_input("Page", min_value=1, max_value=total_pages, step=1, key="vuln_page")
+            
+            start = (page - 1) * page_size
+            page_vulns = all_vulns[start:start + page_size]
+            st.caption(f"Showing {start + 1}-{start + len(page_vulns)} of {len(all_vulns)} vulnerabilities")
+            
             # Display vulnerabilities table without PyArrow
-            st.markdown("| Target | Title | Severity | Service | CVE Links |")
-            st.markdown("|--------|-------|----------|---------|-----------|")
-            for vuln in all_vulns:
-                severity = vuln.get('severity', 'low').title()
-                severity_icon = "🔴" if severity.lower() == 'critical' else "🟠" if severity.lower() == 'high' else "🟡" if severity.lower() == 'medium' else "🟢"
-                
-                # Create CVE links if CVE ID exists
-                cve_links = ""
-                if vuln.get('cve_id'):
-                    cve_id = vuln.get('cve_id')
-                    cve_links = f"[NVD](https://nvd.nist.gov/vuln/detail/{cve_id}) • [Details](https://www.cvedetails.com/cve/{cve_id}/) • [MITRE](https://cve.mitre.org/cgi-bin/cvename.cgi?name={cve_id})"
-                else:
-                    cve_links = "N/A"
-                
-                st.markdown(f"| {vuln.get('target', 'Unknown')} | {vuln.get('title', 'Unknown')} | {severity_icon} {severity} | {vuln.get('affected_service', 'Unknown')} | {cve_links} |")
+            vuln_rows = [
+                f"| {escape_table_cell(target)} | {escape_table_cell(vuln.title)} | "
+                f"{SEVERITY_ICONS[vuln.severity]} {vuln.severity.title()} | {escape_table_cell(vuln.service)} | "
+                f"{CVE_TEMPLATE.format(c=escape_table_cell(vuln.cve_id)) if vuln.cve_id else 'N/A'} |"
+                for target, vuln in page_vulns
+            ]
+            st.markdown("\n".join([
+                "| Target | Title | Severity | Service | CVE Links |",
+                "|--------|-------|----------|---------|-----------|",
+                *vuln_rows
+            ]))
     else:
         st.success("✅ No vulnerabilities found across all reports")
+    
+    render_batch_ai_analysis(reports)
+
+def render_batch_ai_analysis(reports):
+    """Render AI analysis generation for every selected report that lacks one"""
+    analyzer = st.session_state.ai_analyzer
+    if not analyzer.is_enabled():
+        return
+    
+    st.markdown("### 🤖 AI Analysis")
+    
+    # Failures from a partly successful batch are carried across the rerun that refreshed the counts
+    batch_error = st.session_state.pop('batch_ai_error', None)
+    if batch_error:
+        st.error(batch_error)
+    
+    # Read the cache once for all reports instead of once per report
+    cache = load_ai_cache()
+    pending = [
+        report for report in reports
+        if not report.get('ai_summary') and not cache.get(get_report_cache_key(report))
+    ]
+    st.caption(f"{len(reports) - len(pending)} of {len(reports)} selected reports have an AI analysis")
+    
+    if pending and st.button(f"🧠 Generate AI Analysis for {len(pending)} Reports", key="gen_batch"):
+        progress = st.progress(0.0, text="Generating AI threat analyses...")
+        
+        def report_progress(completed, total, target):
+            progress.progress(completed / total, text=f"Analyzed {target} ({completed}/{total})")
+        
+        # Requests run concurrently with paced starts; results come back in report order
+        summaries = analyzer.generate_summaries_batch(pending, progress_callback=report_progress, use_cache=False)
+        
+        generated = 0
+        for report, summary in zip(pending, summaries):
+            if summary and summary.strip():
+                cache_ai_summary(report, summary)
+                generated += 1
+        
+        failed = len(pending) - generated
+        if failed:
+            error_msg = f"❌ Failed to generate {failed} of {len(pending)} analyses - check your API key and try again"
+            if not generated:
+                st.error(error_msg)
+                return
+            st.session_state.batch_ai_error = error_msg
+        else:
+            st.success(f"✅ Generated and cached {generated} analyses!")
+        st.rerun()
 
 def calculate_risk_level(report):
     """Calculate overall risk level for a report"""
-    vulnerabilities = report.get('vulnerabilities', [])
+    vulnerabilities = report['_vulnerabilities']
     
     if not vulnerabilities:
         return "🟢 Low"
     
-    severity_scores = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
-    total_score = 0
-    
-    for vuln in vulnerabilities:
-        severity = vuln.get('severity', 'low').lower()
-        total_score += severity_scores.get(severity, 1)
-    
+    # Score from the per-severity groups built at load time instead of rescanning every vulnerability
+    total_score = sum(
+        SEVERITY_SCORES[severity] * len(vulns)
+        for severity, vulns in report['_vulnerabilities_by_severity'].items()
+    )
     avg_score = total_score / len(vulnerabilities)
-    
-    if avg_score >= 3.5:
-        return "🔴 Critical"
-    elif avg_score >= 2.5:
-        return "🟠 High"
-    elif avg_score >= 1.5:
-        return "🟡 Medium"
-    else:
-        return "🟢 Low"
+    return RISK_LABELS[bisect_right(RISK_THRESHOLDS, avg_score)]
 
-def render_cve_links(cve_id):
-    """Render clickable CVE links for research"""
-    if not cve_id:
-        return
-    
-    st.markdown("**🔗 CVE Research Links:**")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"🏛️ [NIST NVD](https://nvd.nist.gov/vuln/detail/{cve_id})")
-        st.caption("Official US database")
-    
-    with col2:
-        st.markdown(f"📊 [CVE Details](https://www.cvedetails.com/cve/{cve_id}/)")
-        st.caption("Detailed statistics")
+def format_cve_links(cve_id):
+    """Format research links for a CVE as a single markdown line"""
+    return CVE_LINKS_TEMPLATE.format(c=cve_id)
+
+@st_fragment
+def render_cve_research():
+    """Render the sidebar CVE lookup; call inside a `with st.sidebar:` block"""
+    st.markdown("---")
+    st.subheader("🔍 CVE Research")
     
-    with col3:
-        st.markdown(f"🎯 [MITRE](https://cve.mitre.org/cgi-bin/cvename.cgi?name={cve_id})")
-        st.caption("Original CVE entry")
+    cve_search = st.text_input(
+        "Quick CVE Lookup:",
+        placeholder="e.g., CVE-2023-1234",
+        help="Enter a CVE ID to get research links"
+    )
     
-    with col4:
-        st.markdown(f"🔍 [Exploit-DB](https://www.exploit-db.com/search?cve={cve_id})")
-        st.caption("Known exploits")
+    cve_id = cve_search.strip().upper() if cve_search else ''
+    if cve_id:
+        if cve_id.startswith('CVE-'):
+            # Heading and links go out as a single markdown element
+            st.markdown(CVE_RESEARCH_TEMPLATE.format(c=cve_id))
+        else:
+            st.warning("⚠️ Please enter a valid CVE ID (e.g., CVE-2023-1234)")
 
 def main():
     """Main application function"""
@@ -780,6 +1167,9 @@ def main():
     # Initialize components
     initialize_components()
     
+    # Bind the session state proxy once; it is read throughout every rerun
+    ss = st.session_state
+    
     # Header
     st.markdown('<h1 class="main-header">🛡️ AI Threat Hunting Dashboard</h1>', unsafe_allow_html=True)
     
@@ -803,6 +1193,15 @@ def main():
     # Report selection
     st.sidebar.success(f"✅ {len(reports)} reports available")
     
+    # Keep the option labels in session state so widget-only reruns skip the cache lookup and copy;
+    # they are rebuilt only when the loaded reports change
+    reports_fingerprint = get_reports_fingerprint(reports)
+    report_index = ss.get('report_index')
+    if report_index is None or report_index[0] != reports_fingerprint:
+        report_index = (reports_fingerprint, *_build_report_index(reports_fingerprint, reports))
+        ss.report_index = report_index
+    _, report_options, all_targets, label_index = report_index
+    
     # Single or multiple selection
     selection_mode = st.sidebar.radio(
         "Analysis Mode:",
@@ -813,29 +1212,46 @@ def main():
     
     if selection_mode == "📋 Single Report":
         # Single report selection
-        report_options = [f"{r.get('target', 'Unknown')} ({r.get('scan_date', 'Unknown')})" for r in reports]
-        selected_report_idx = st.sidebar.selectbox(
+        selected_label = st.sidebar.selectbox(
             "Select a report:",
-            range(len(reports)),
-            format_func=lambda x: report_options[x],
+            report_options,
             key="single_report_selector"
         )
         
-        selected_reports = [reports[selected_report_idx]]
+        selected_reports = [reports[label_index[selected_label]]]
         
     elif selection_mode == "📊 Compare Multiple":
         # Multiple report selection
         st.sidebar.info("📊 Multi-Report Comparison Mode")
-        all_targets = [r.get('target', 'Unknown') for r in reports]
+        default_targets = all_targets[:min(len(all_targets), 3)]  # Default to first 3 to avoid overwhelming
+        
+        # Only a filtered, capped slice of targets is offered so the widget stays fast with many reports;
+        # current picks are always kept as options so filtering never drops them
+        target_query = st.sidebar.text_input(
+            "Filter targets:",
+            placeholder="Type to search targets...",
+            key="target_filter"
+        ).strip().lower()
+        matching_targets = [t for t in all_targets if target_query in t.lower()] if target_query else all_targets
+        # Seed the selection through session state rather than `default`, which Streamlit checks
+        # against the (filtered) options on every rerun
+        if "multi_report_selector" not in ss:
+            ss.multi_report_selector = default_targets
+        current_targets = ss.multi_report_selector
+        target_options = list(dict.fromkeys([*current_targets, *matching_targets[:MAX_TARGET_OPTIONS]]))
+        if len(matching_targets) > MAX_TARGET_OPTIONS:
+            st.sidebar.caption(f"Showing {MAX_TARGET_OPTIONS} of {len(matching_targets)} matching targets; refine the filter to see more")
+        
         selected_targets = st.sidebar.multiselect(
             "Select targets to compare:",
-            options=all_targets,
-            default=all_targets[:min(len(all_targets), 3)],  # Default to first 3 to avoid overwhelming
+            options=target_options,
             help="Choose which reports to include in the analysis",
             key="multi_report_selector"
         )
         
-        selected_reports = [r for r in reports if r.get('target', 'Unknown') in selected_targets]
+        # Set membership keeps the filter linear in the number of reports
+        selected_target_set = set(selected_targets)
+        selected_reports = [r for r in reports if r.get('target', 'Unknown') in selected_target_set]
         
         if not selected_targets:
             st.sidebar.warning("⚠️ Please select at least one report to compare")
@@ -871,27 +1287,32 @@ def main():
         help="Save API key locally for future sessions"
     )
     
-    if api_key_input and api_key_input.strip():
+    # Strip the key once per rerun; every use below shares the cleaned value
+    api_key = api_key_input.strip() if api_key_input else ''
+    
+    if api_key:
         # Save API key if requested
         if save_key:
-            save_api_key(api_key_input.strip())
+            save_api_key(api_key)
         elif not save_key and saved_api_key:
             # Clear saved key if unchecked
             clear_api_key()
         
-        os.environ['OPENROUTER_API_KEY'] = api_key_input.strip()
+        # Environment writes call putenv, so only write when the key changes
+        if os.environ.get('OPENROUTER_API_KEY') != api_key:
+            os.environ['OPENROUTER_API_KEY'] = api_key
+        
+        # Persistent debug info in session state
+        debug_info = ss.setdefault('debug_info', {})
         try:
-            # Create AI analyzer with the provided key
-            st.session_state.ai_analyzer = AIAnalyzer(api_key=api_key_input.strip())
-            
-            # Persistent debug info in session state
-            if 'debug_info' not in st.session_state:
-                st.session_state.debug_info = {}
+            # Reuse the shared AI analyzer for the provided key
+            analyzer = get_ai_analyzer(api_key)
+            ss.ai_analyzer = analyzer
             
-            st.session_state.debug_info['api_key_length'] = len(api_key_input.strip())
-            st.session_state.debug_info['ai_enabled'] = st.session_state.ai_analyzer.is_enabled()
+            debug_info['api_key_length'] = len(api_key)
+            debug_info['ai_enabled'] = analyzer.is_enabled()
             
-            if st.session_state.ai_analyzer.is_enabled():
+            if analyzer.is_enabled():
                 # Test API key validation
                 col1, col2 = st.sidebar.columns(2)
                 
@@ -900,27 +1321,27 @@ def main():
                         with st.spinner("Testing..."):
                             try:
                                 # First check API key format
-                                format_valid, format_msg = st.session_state.ai_analyzer.check_api_key_format()
+                                format_valid, format_msg = analyzer.check_api_key_format()
                                 if not format_valid:
                                     st.error(f"❌ {format_msg}")
                                     st.info("💡 Get your API key from [OpenRouter.ai](https://openrouter.ai/keys)")
                                     return
                                 
                                 # Then validate with API
-                                is_valid = st.session_state.ai_analyzer.validate_api_key()
-                                st.session_state.debug_info['api_validation'] = is_valid
+                                is_valid = validate_api_key_cached(api_key, analyzer)
+                                debug_info['api_validation'] = is_valid
                                 if is_valid:
                                     st.success("✅ API key is valid!")
                                     # Also save the key if validation succeeds
                                     if save_key:
-                                        save_api_key(api_key_input.strip())
+                                        save_api_key(api_key)
                                         st.info("💾 API key saved successfully")
                                 else:
                                     st.error("❌ API key validation failed!")
                                     st.info("💡 Make sure you have credits and the key is active")
                             except Exception as test_error:
-                                st.session_state.debug_info['validation_error'] = str(test_error)
-                                st.error(f"❌ Validation error: {str(test_error)}")
+                                debug_info['validation_error'] = str(test_error)
+                                st.error(f"❌ Validation error: {test_error}")
                 
                 with col2:
                     if st.button("🤖 Quick Test"):
@@ -931,27 +1352,26 @@ def main():
                                     "vulnerabilities": [{"severity": "high", "title": "Test vulnerability"}],
                                     "open_ports": {"80": "http"}
                                 }
-                                summary = st.session_state.ai_analyzer.generate_summary(test_report)
+                                # Always hit the API so a revoked key is not reported as working
+                                summary = analyzer.generate_summary(test_report, use_cache=False)
                                 if summary:
                                     st.success("✅ AI Working!")
-                                    st.session_state.debug_info['ai_test'] = "Success"
+                                    debug_info['ai_test'] = "Success"
                                 else:
                                     st.error("❌ AI Failed!")
-                                    st.session_state.debug_info['ai_test'] = "Failed"
+                                    debug_info['ai_test'] = "Failed"
                             except Exception as ai_error:
                                 st.error(f"❌ AI Error!")
-                                st.session_state.debug_info['ai_test_error'] = str(ai_error)
+                                debug_info['ai_test_error'] = str(ai_error)
             else:
                 st.sidebar.warning("⚠️ AI analyzer not enabled")
         except Exception as e:
-            st.session_state.debug_info['setup_error'] = str(e)
-            st.sidebar.error(f"❌ AI setup failed: {str(e)}")
+            debug_info['setup_error'] = str(e)
+            st.sidebar.error(f"❌ AI setup failed: {e}")
     
     # Show persistent debug info
-    if 'debug_info' in st.session_state and st.session_state.debug_info:
-        with st.sidebar.expander("🔍 Debug Info"):
-            for key, value in st.session_state.debug_info.items():
-                st.write(f"{key}: {value}")
+    if ss.get('debug_info'):
+        render_debug_info(st.sidebar, "🔍 Debug Info", ss.debug_info)
     else:
         st.sidebar.info("💡 Enter API key to enable AI analysis")
     
@@ -969,37 +1389,18 @@ def main():
             st.sidebar.success("✅ Cache cleared!")
             st.rerun()
     
-    # CVE Research Tool
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("🔍 CVE Research")
-    
-    cve_search = st.sidebar.text_input(
-        "Quick CVE Lookup:",
-        placeholder="e.g., CVE-2023-1234",
-        help="Enter a CVE ID to get research links"
-    )
-    
-    if cve_search and cve_search.strip():
-        cve_id = cve_search.strip().upper()
-        if cve_id.startswith('CVE-'):
-            st.sidebar.markdown("**🔗 Research Links:**")
-            st.sidebar.markdown(f"🏛️ [NIST NVD](https://nvd.nist.gov/vuln/detail/{cve_id})")
-            st.sidebar.markdown(f"📊 [CVE Details](https://www.cvedetails.com/cve/{cve_id}/)")
-            st.sidebar.markdown(f"🎯 [MITRE](https://cve.mitre.org/cgi-bin/cvename.cgi?name={cve_id})")
-            st.sidebar.markdown(f"🔍 [Exploit-DB](https://www.exploit-db.com/search?cve={cve_id})")
-        else:
-            st.sidebar.warning("⚠️ Please enter a valid CVE ID (e.g., CVE-2023-1234)")
+    # CVE Research Tool; a fragment, so typing a CVE ID reruns only this block
+    with st.sidebar:
+        render_cve_research()
     
     # Refresh button
     if st.sidebar.button("🔄 Refresh Data"):
-        # Clear all caches
+        # Drop every cached report, aggregation and figure so they are rebuilt from disk
         st.cache_data.clear()
         
         # Clear session state to force reload
-        if 'analytics' in st.session_state:
-            del st.session_state.analytics
-        if 'ai_analyzer' in st.session_state:
-            del st.session_state.ai_analyzer
+        ss.pop('analytics', None)
+        ss.pop('ai_analyzer', None)
             
         st.success("✅ Data refreshed! Reloading...")
         st.rerun()
@@ -1009,8 +1410,12 @@ def main():
         st.warning("⚠️ No reports selected. Choose reports from the sidebar.")
         return
     
+    # Aggregate the selection once; the KPI cards and comparison charts share the result
+    fingerprint = get_reports_fingerprint(selected_reports)
+    aggregates = _cached_aggregates(fingerprint, selected_reports)
+    
     # Render KPIs
-    render_kpi_cards(selected_reports)
+    render_kpi_cards(selected_reports, aggregates)
     
     st.markdown("---")
     
@@ -1018,51 +1423,40 @@ def main():
     if len(selected_reports) == 1:
         render_single_report_view(selected_reports[0])
     else:
-        render_multi_report_view(selected_reports)
+        render_multi_report_view(selected_reports, fingerprint, aggregates)
     
     # CVE Summary Section
+    cve_count = 0
     if len(selected_reports) > 0:
         st.markdown("---")
         st.subheader("🎯 CVE Summary")
         
-        # Collect all CVEs from selected reports
-        all_cves = []
-        for report in selected_reports:
-            for vuln in report.get('vulnerabilities', []):
-                if vuln.get('cve_id'):
-                    all_cves.append({
-                        'cve_id': vuln.get('cve_id'),
-                        'target': report.get('target', 'Unknown'),
-                        'title': vuln.get('title', 'Unknown'),
-                        'severity': vuln.get('severity', 'low')
-                    })
+        cve_by_severity = _group_cves_by_severity(fingerprint, selected_reports)
+        cve_count = sum(len(cves) for cves in cve_by_severity.values())
         
-        if all_cves:
-            st.write(f"**Found {len(all_cves)} CVEs across selected reports:**")
-            
-            # Group by severity
-            cve_by_severity = {'critical': [], 'high': [], 'medium': [], 'low': []}
-            for cve in all_cves:
-                severity = cve['severity'].lower()
-                if severity in cve_by_severity:
-                    cve_by_severity[severity].append(cve)
-                else:
-                    cve_by_severity['low'].append(cve)
+        if cve_count:
+            st.write(f"**Found {cve_count} unique CVEs across selected reports:**")
             
             # Display by severity
             for severity, cves in cve_by_severity.items():
                 if cves:
-                    severity_icons = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🟢'}
-                    icon = severity_icons.get(severity, '⚪')
-                    
-                    with st.expander(f"{icon} {severity.title()} Severity CVEs ({len(cves)})", expanded=severity in ['critical', 'high']):
-                        for cve in cves:
-                            col1, col2 = st.columns([2, 1])
-                            with col1:
-                                st.write(f"**{cve['cve_id']}** - {cve['title']} ({cve['target']})")
-                            with col2:
-                                # Quick research links
-                                st.markdown(f"[NVD](https://nvd.nist.gov/vuln/detail/{cve['cve_id']}) • [Details](https://www.cvedetails.com/cve/{cve['cve_id']}/)")
+                    with st.expander(
+                        f"{SEVERITY_ICONS[severity]} {severity.title()} Severity CVEs ({len(cves)})",
+                        expanded=severity in EXPANDED_SEVERITIES
+                    ):
+                        # One markdown table per severity instead of a column pair per CVE
+                        cve_rows = []
+                        for cve_id, title, targets in cves:
+                            cve_cell = escape_table_cell(cve_id)
+                            cve_rows.append(
+                                f"| **{cve_cell}** | {escape_table_cell(title)} | {escape_table_cell(targets)} | "
+                                f"{CVE_TEMPLATE.format(c=cve_cell)} |"
+                            )
+                        st.markdown("\n".join([
+                            "| CVE | Title | Targets | Research Links |",
+                            "|-----|-------|--------|----------------|",
+                            *cve_rows
+                        ]))
         else:
             st.success("✅ No CVEs found in selected reports")
     
@@ -1072,8 +1466,7 @@ def main():
     with col1:
         st.caption("*AI Threat Hunting Dashboard - Enhanced with CVE Research*")
     with col2:
-        ai_status = "✅" if st.session_state.ai_analyzer.is_enabled() else "❌"
-        cve_count = len([v for r in selected_reports for v in r.get('vulnerabilities', []) if v.get('cve_id')])
+        ai_status = "✅" if ss.ai_analyzer.is_enabled() else "❌"
         st.caption(f"Reports: {len(selected_reports)} | CVEs: {cve_count} | AI: {ai_status}")
 
 if __name__ == "__main__":
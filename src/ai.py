@@ -10,10 +10,79 @@ import os
 import json
 import time
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any, Callable
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+try:
+    from .rate_limiter import RateLimiter
+except ImportError:
+    # Loaded as a top-level module with src/ on sys.path, as dashboard.py does
+    from rate_limiter import RateLimiter
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _vulnerability_sort_key(vuln: Dict[str, Any]) -> tuple:
+    """Order vulnerabilities by severity and title; str() keeps mixed-type values sortable without reordering string ones."""
+    return str(vuln["severity"]), str(vuln["title"])
+
+
+def compute_report_cache_key(report: Dict[str, Any]) -> str:
+    """
+    Generate the content-based cache key shared by every AI summary cache.
+    
+    Only the fields that feed the AI prompt take part, in a canonical order,
+    so the key is stable across processes and independent of dict ordering.
+    
+    Args:
+        report: Report dictionary
+        
+    Returns:
+        32-character hex digest of the report content
+    """
+    cache_data = {
+        "target": report.get("target", ""),
+        "scan_date": report.get("scan_date", ""),
+        "subdomains": sorted(report.get("subdomains", [])),
+        # sort_keys below already orders the port mapping
+        "open_ports": report.get("open_ports", {}),
+        "vulnerabilities": sorted([
+            {
+                "severity": v.get("severity", ""),
+                "title": v.get("title", ""),
+                "description": v.get("description", "")
+            }
+            for v in report.get("vulnerabilities", [])
+        ], key=_vulnerability_sort_key)
+    }
+    
+    cache_string = json.dumps(cache_data, sort_keys=True)
+    return hashlib.blake2b(cache_string.encode(), digest_size=16).hexdigest()
+
+
+def estimate_request_tokens(payload: Dict[str, Any]) -> int:
+    """
+    Roughly estimate the tokens a chat completion request will consume.
+    
+    Uses about four characters per token for the messages plus the
+    requested completion budget, which is close enough for rate limiting.
+    
+    Args:
+        payload: Chat completion request payload
+        
+    Returns:
+        Estimated prompt plus completion tokens
+    """
+    prompt_chars = sum(len(message.get("content", "")) for message in payload.get("messages", []))
+    return prompt_chars // 4 + payload.get("max_tokens", 0)
 
 
 class AIAnalyzer:
@@ -23,19 +92,26 @@ class AIAnalyzer:
     Handles API key validation, request formatting, error handling, and response caching.
     """
     
-    def __init__(self, api_key: Optional[str] = None, timeout: int = 30):
+    def __init__(self, api_key: Optional[str] = None, timeout: int = 30,
+                 requests_per_minute: float = 20, tokens_per_minute: Optional[float] = None,
+                 max_cache_entries: int = 256):
         """
         Initialize the AI analyzer.
         
         Args:
             api_key: OpenRouter API key. If None, will check environment variable.
             timeout: Request timeout in seconds (default: 30)
+            requests_per_minute: Client-side request budget (default: 20, the free model limit)
+            tokens_per_minute: Optional client-side token budget
+            max_cache_entries: Maximum number of summaries kept in memory; the oldest are evicted first
         """
         self.api_key = api_key or self._get_api_key_from_env()
         self.timeout = timeout
         self.base_url = "https://openrouter.ai/api/v1"
         self.model = "meta-llama/llama-3.2-3b-instruct:free"  # Free model for testing
         self.cache = {}  # In-memory cache for AI summaries
+        self.max_cache_entries = max_cache_entries
+        self._cache_lock = threading.Lock()
         
         # Configure session with retry strategy
         self.session = requests.Session()
@@ -47,6 +123,9 @@ class AIAnalyzer:
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        
+        # Hold requests back until they fit the rate budget instead of relying on 429 retries
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
     
     def _get_api_key_from_env(self) -> Optional[str]:
         """
@@ -113,6 +192,7 @@ class AIAnalyzer:
                 "max_tokens": 5
             }
             
+            self.rate_limiter.acquire(estimate_request_tokens(test_payload))
             response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=headers,
@@ -148,29 +228,12 @@ class AIAnalyzer:
             print("API Key validation failed: Connection error")
             return False
         except Exception as e:
-            print(f"API Key validation failed: {str(e)}")
+            print(f"API Key validation failed: {e}")
             return False
     
     def _generate_cache_key(self, report: Dict[str, Any]) -> str:
         """Generate a cache key for a report to avoid duplicate API calls."""
-        # Use same logic as ReportAICache.get_cache_key for consistency
-        cache_data = {
-            "target": report.get("target", ""),
-            "scan_date": report.get("scan_date", ""),
-            "subdomains": sorted(report.get("subdomains", [])),
-            "open_ports": dict(sorted(report.get("open_ports", {}).items())),
-            "vulnerabilities": sorted([
-                {
-                    "severity": v.get("severity", ""),
-                    "title": v.get("title", ""),
-                    "description": v.get("description", "")
-                }
-                for v in report.get("vulnerabilities", [])
-            ], key=lambda x: (x["severity"], x["title"]))
-        }
-        
-        cache_string = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(cache_string.encode()).hexdigest()
+        return compute_report_cache_key(report)
     
     def format_prompt(self, report: Dict[str, Any]) -> str:
         """
@@ -222,12 +285,21 @@ Keep the response concise but actionable for a security analyst."""
         
         return prompt    
 
-    def generate_summary(self, report: Dict[str, Any]) -> Optional[str]:
+    def _remember_summary(self, cache_key: str, summary: str) -> None:
+        """Store a summary in the in-memory cache, evicting the oldest entries past the limit."""
+        with self._cache_lock:
+            self.cache.pop(cache_key, None)
+            self.cache[cache_key] = summary
+            while len(self.cache) > self.max_cache_entries:
+                del self.cache[next(iter(self.cache))]
+    
+    def generate_summary(self, report: Dict[str, Any], use_cache: bool = True) -> Optional[str]:
         """
         Generate AI threat summary for a report.
         
         Args:
             report: Report dictionary containing scan results
+            use_cache: Return an in-memory summary when one exists; pass False to always call the API
             
         Returns:
             AI-generated threat summary string, or None if generation fails
@@ -237,8 +309,10 @@ Keep the response concise but actionable for a security analyst."""
         
         # Check cache first
         cache_key = self._generate_cache_key(report)
-        if cache_key in self.cache:
-            return self.cache[cache_key]
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
         
         try:
             headers = {
@@ -265,6 +339,7 @@ Keep the response concise but actionable for a security analyst."""
                 "top_p": 0.9
             }
             
+            self.rate_limiter.acquire(estimate_request_tokens(payload))
             response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=headers,
@@ -283,7 +358,7 @@ Keep the response concise but actionable for a security analyst."""
                         # Check if summary is not empty
                         if summary:
                             # Cache the result
-                            self.cache[cache_key] = summary
+                            self._remember_summary(cache_key, summary)
                             return summary
                         else:
                             print(f"AI API Warning: Empty summary returned for target {report.get('target', 'unknown')}")
@@ -325,7 +400,7 @@ Keep the response concise but actionable for a security analyst."""
             return None
         
         except requests.exceptions.RequestException as e:
-            print(f"AI API Error: Request failed - {str(e)}")
+            print(f"AI API Error: Request failed - {e}")
             return None
         
         except json.JSONDecodeError:
@@ -333,9 +408,69 @@ Keep the response concise but actionable for a security analyst."""
             return None
         
         except Exception as e:
-            print(f"AI API Error: Unexpected error - {str(e)}")
+            print(f"AI API Error: Unexpected error - {e}")
             return None
     
+    def generate_summaries_batch(self, reports: List[Dict[str, Any]], max_workers: int = 8,
+                                 progress_callback: Optional[Callable[..., Any]] = None,
+                                 min_interval: float = 0.25, use_cache: bool = True) -> List[Optional[str]]:
+        """
+        Generate AI threat summaries for several reports concurrently.
+        
+        Each request spends almost all of its time waiting on the network, so
+        requests are issued from a bounded thread pool instead of one by one.
+        Request starts are spaced at least min_interval seconds apart to stay
+        under the API rate limit; a worker only waits when its slot is still ahead.
+        
+        Args:
+            reports: List of report dictionaries
+            max_workers: Maximum number of requests in flight at once
+            progress_callback: Optional callback invoked as (completed, total, target)
+                from the calling thread each time a request finishes
+            min_interval: Minimum number of seconds between request starts
+            use_cache: Passed through to generate_summary
+            
+        Returns:
+            List of summaries in the same order as reports, with None where generation failed
+        """
+        summaries: List[Optional[str]] = [None] * len(reports)
+        
+        if not reports or not self.is_enabled():
+            return summaries
+        
+        slot_lock = threading.Lock()
+        next_slot = [time.monotonic()]
+        
+        def paced_summary(report: Dict[str, Any]) -> Optional[str]:
+            # Reserve the next start slot, then wait for it outside the lock
+            with slot_lock:
+                start_at = max(next_slot[0], time.monotonic())
+                next_slot[0] = start_at + min_interval
+            delay = start_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            return self.generate_summary(report, use_cache=use_cache)
+        
+        workers = max(1, min(max_workers, len(reports)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(paced_summary, report): i
+                for i, report in enumerate(reports)
+            }
+            
+            for completed, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                try:
+                    summaries[index] = future.result()
+                except Exception as e:
+                    print(f"AI API Error: Batch request failed - {e}")
+                
+                if progress_callback:
+                    target = reports[index].get("target", f"report_{index}")
+                    progress_callback(completed, len(reports), target)
+        
+        return summaries
+    
     def get_cached_summary(self, report: Dict[str, Any]) -> Optional[str]:
         """
         Get cached AI summary for a report without making API call.
@@ -351,7 +486,8 @@ Keep the response concise but actionable for a security analyst."""
     
     def clear_cache(self) -> None:
         """Clear all cached AI summaries."""
-        self.cache.clear()
+        with self._cache_lock:
+            self.cache.clear()
     
     def get_cache_stats(self) -> Dict[str, int]:
         """
@@ -449,8 +585,10 @@ class ReportAICache:
         """Load cache from persistent storage if available."""
         if os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self.memory_cache = json.load(f)
+                with open(self.cache_file, 'rb') as f:
+                    raw_data = f.read()
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                self.memory_cache = orjson.loads(raw_data) if ORJSON_AVAILABLE else json.loads(raw_data)
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load AI cache from {self.cache_file}: {e}")
                 self.memory_cache = {}
@@ -458,8 +596,12 @@ class ReportAICache:
     def save_persistent_cache(self) -> None:
         """Save cache to persistent storage."""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.memory_cache, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(self.cache_file, 'wb') as f:
+                    f.write(orjson.dumps(self.memory_cache, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.memory_cache, f, indent=2)
         except IOError as e:
             print(f"Warning: Could not save AI cache to {self.cache_file}: {e}")
     
@@ -473,24 +615,7 @@ class ReportAICache:
         Returns:
             Cache key string
         """
-        # Create a stable representation of the report content
-        cache_data = {
-            "target": report.get("target", ""),
-            "scan_date": report.get("scan_date", ""),
-            "subdomains": sorted(report.get("subdomains", [])),
-            "open_ports": dict(sorted(report.get("open_ports", {}).items())),
-            "vulnerabilities": sorted([
-                {
-                    "severity": v.get("severity", ""),
-                    "title": v.get("title", ""),
-                    "description": v.get("description", "")
-                }
-                for v in report.get("vulnerabilities", [])
-            ], key=lambda x: (x["severity"], x["title"]))
-        }
-        
-        cache_string = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(cache_string.encode()).hexdigest()
+        return compute_report_cache_key(report)
     
     def get_cached_summary(self, report: Dict[str, Any]) -> Optional[str]:
         """
@@ -694,6 +819,9 @@ class EnhancedAIAnalyzer(AIAnalyzer):
         """
         Generate AI summaries for multiple reports with progress tracking.
         
+        Cached summaries are returned directly; the remaining reports are sent
+        to the API concurrently via generate_summaries_batch.
+        
         Args:
             reports: List of report dictionaries
             force_refresh: If True, bypass cache for all reports
@@ -704,18 +832,43 @@ class EnhancedAIAnalyzer(AIAnalyzer):
         """
         results = {}
         
+        if not self.is_enabled():
+            return results
+        
+        pending = []
+        cached_count = 0
         for i, report in enumerate(reports):
             target = report.get("target", f"report_{i}")
             
-            if progress_callback:
-                progress_callback(i, len(reports), target)
+            if not force_refresh:
+                cached_summary = self.report_cache.get_cached_summary(report)
+                if cached_summary:
+                    results[target] = cached_summary
+                    cached_count += 1
+                    if progress_callback:
+                        progress_callback(cached_count, len(reports), target)
+                    continue
             
-            summary = self.generate_summary_for_report(report, force_refresh)
+            pending.append((target, report))
+        
+        if not pending:
+            return results
+        
+        def batch_progress(completed, total, target):
+            if progress_callback:
+                progress_callback(cached_count + completed, len(reports), target)
+        
+        summaries = self.generate_summaries_batch(
+            [report for _, report in pending],
+            progress_callback=batch_progress
+        )
+        
+        # Persist results from this thread; ReportAICache is not thread-safe
+        for (target, report), summary in zip(pending, summaries):
             if summary:
+                self.report_cache.cache_summary(report, summary)
+                report["ai_summary"] = summary
                 results[target] = summary
-            
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.1)
         
         return results
     
@@ -9,6 +9,32 @@ import logging
 from typing import List, Dict, Optional, Tuple, Any
 from datetime import datetime, date
 from collections import Counter, defaultdict
+from functools import lru_cache
+
+
+# Common date formats to try, in order
+DATE_FORMATS = (
+    '%Y-%m-%d',
+    '%Y/%m/%d',
+    '%d-%m-%Y',
+    '%d/%m/%Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y/%m/%d %H:%M:%S'
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date_string: str) -> Optional[datetime]:
+    """Parse a date string against DATE_FORMATS; cached because datetimes are immutable."""
+    stripped = date_string.strip()
+    
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(stripped, fmt)
+        except ValueError:
+            continue
+            
+    return None
 
 
 class ReportAnalytics:
@@ -37,61 +63,77 @@ class ReportAnalytics:
             - avg_open_ports: Average number of open ports per target
             - total_vulnerabilities: Total number of vulnerabilities found
         """
-        if not reports:
-            return {
-                'total_reports': 0,
-                'total_subdomains': 0,
-                'avg_open_ports': 0.0,
-                'total_vulnerabilities': 0
-            }
+        kpis = self.calculate_overview(reports)['kpis']
+        self.logger.debug("Calculated KPIs: %s", kpis)
+        return kpis
+    
+    def calculate_overview(self, reports: List[Dict]) -> Dict[str, Any]:
+        """
+        Calculate KPIs, subdomain counts and port distribution in a single pass.
         
-        try:
-            # Total number of reports
-            total_reports = len(reports)
-            
-            # Collect all unique subdomains
-            all_subdomains = set()
-            total_ports = 0
-            total_vulnerabilities = 0
+        calculate_kpis, get_subdomain_counts and get_port_distribution each
+        return their part of this result, so the counting rules live here only.
+        
+        Args:
+            reports: List of report dictionaries
             
+        Returns:
+            Dictionary with 'kpis', 'subdomain_counts' and 'port_distribution'
+        """
+        all_subdomains = set()
+        subdomain_counts = {}
+        port_counter = Counter()
+        total_ports = 0
+        total_vulnerabilities = 0
+        
+        try:
             for report in reports:
                 # Skip None reports
                 if report is None or not isinstance(report, dict):
                     continue
-                    
-                # Add subdomains to the set (automatically handles uniqueness)
-                if 'subdomains' in report and isinstance(report['subdomains'], list):
-                    all_subdomains.update(report['subdomains'])
                 
-                # Count open ports
-                if 'open_ports' in report and isinstance(report['open_ports'], dict):
-                    total_ports += len(report['open_ports'])
+                subdomains = report.get('subdomains', [])
+                if isinstance(subdomains, list):
+                    all_subdomains.update(subdomains)
+                    subdomain_counts[report.get('target', 'Unknown')] = len(subdomains)
+                else:
+                    subdomain_counts[report.get('target', 'Unknown')] = 0
+                
+                open_ports = report.get('open_ports', {})
+                if isinstance(open_ports, dict):
+                    total_ports += len(open_ports)
+                    port_counter.update(open_ports.keys())
                 
-                # Count vulnerabilities
-                if 'vulnerabilities' in report and isinstance(report['vulnerabilities'], list):
-                    total_vulnerabilities += len(report['vulnerabilities'])
-            
-            # Calculate average open ports per target
-            avg_open_ports = total_ports / total_reports if total_reports > 0 else 0.0
-            
-            kpis = {
+                vulnerabilities = report.get('vulnerabilities', [])
+                if isinstance(vulnerabilities, list):
+                    total_vulnerabilities += len(vulnerabilities)
+                    
+        except Exception as e:
+            self.logger.error("Error calculating overview: %s", e)
+            return {
+                'kpis': {
+                    'total_reports': 0,
+                    'total_subdomains': 0,
+                    'avg_open_ports': 0.0,
+                    'total_vulnerabilities': 0
+                },
+                'subdomain_counts': {},
+                'port_distribution': {}
+            }
+        
+        total_reports = len(reports)
+        avg_open_ports = total_ports / total_reports if total_reports > 0 else 0.0
+        
+        return {
+            'kpis': {
                 'total_reports': total_reports,
                 'total_subdomains': len(all_subdomains),
                 'avg_open_ports': round(avg_open_ports, 1),
                 'total_vulnerabilities': total_vulnerabilities
-            }
-            
-            self.logger.debug(f"Calculated KPIs: {kpis}")
-            return kpis
-            
-        except Exception as e:
-            self.logger.error(f"Error calculating KPIs: {str(e)}")
-            return {
-                'total_reports': 0,
-                'total_subdomains': 0,
-                'avg_open_ports': 0.0,
-                'total_vulnerabilities': 0
-            }
+            },
+            'subdomain_counts': subdomain_counts,
+            'port_distribution': dict(port_counter)
+        }
     
     def get_subdomain_counts(self, reports: List[Dict]) -> Dict[str, int]:
         """
@@ -103,22 +145,7 @@ class ReportAnalytics:
         Returns:
             Dictionary mapping target names to subdomain counts
         """
-        subdomain_counts = {}
-        
-        try:
-            for report in reports:
-                target = report.get('target', 'Unknown')
-                subdomains = report.get('subdomains', [])
-                
-                if isinstance(subdomains, list):
-                    subdomain_counts[target] = len(subdomains)
-                else:
-                    subdomain_counts[target] = 0
-                    
-        except Exception as e:
-            self.logger.error(f"Error calculating subdomain counts: {str(e)}")
-            
-        return subdomain_counts
+        return self.calculate_overview(reports)['subdomain_counts']
     
     def get_port_distribution(self, reports: List[Dict]) -> Dict[str, int]:
         """
@@ -130,21 +157,7 @@ class ReportAnalytics:
         Returns:
             Dictionary mapping port numbers to occurrence counts
         """
-        port_counter = Counter()
-        
-        try:
-            for report in reports:
-                open_ports = report.get('open_ports', {})
-                
-                if isinstance(open_ports, dict):
-                    # Count each port occurrence
-                    for port in open_ports.keys():
-                        port_counter[port] += 1
-                        
-        except Exception as e:
-            self.logger.error(f"Error calculating port distribution: {str(e)}")
-            
-        return dict(port_counter)
+        return self.calculate_overview(reports)['port_distribution']
     
     def get_timeline_data(self, reports: List[Dict]) -> List[Tuple[str, int]]:
         """
@@ -173,11 +186,11 @@ class ReportAnalytics:
                                 date_str = parsed_date.strftime('%Y-%m-%d')
                                 date_counter[date_str] += 1
                     except Exception as date_error:
-                        self.logger.warning(f"Could not parse date '{scan_date}': {str(date_error)}")
+                        self.logger.warning("Could not parse date '%s': %s", scan_date, date_error)
                         continue
                         
         except Exception as e:
-            self.logger.error(f"Error generating timeline data: {str(e)}")
+            self.logger.error("Error generating timeline data: %s", e)
             
         # Sort by date and return as list of tuples
         sorted_dates = sorted(date_counter.items())
@@ -208,7 +221,7 @@ class ReportAnalytics:
             filters.get('keyword_search', '').strip(),
             filters.get('show_ai_summaries') is True
         ]):
-            self.logger.debug(f"No active filters, returning all {len(reports)} reports")
+            self.logger.debug("No active filters, returning all %s reports", len(reports))
             return reports
             
         filtered_reports = reports.copy()
@@ -221,7 +234,7 @@ class ReportAnalytics:
                     report for report in filtered_reports
                     if report.get('target', '') in selected_targets
                 ]
-                self.logger.debug(f"After target filter: {len(filtered_reports)} reports")
+                self.logger.debug("After target filter: %s reports", len(filtered_reports))
             
             # Filter by date range
             date_range = filters.get('date_range')
@@ -231,13 +244,13 @@ class ReportAnalytics:
                     filtered_reports = self._filter_by_date_range(
                         filtered_reports, start_date, end_date
                     )
-                    self.logger.debug(f"After date filter: {len(filtered_reports)} reports")
+                    self.logger.debug("After date filter: %s reports", len(filtered_reports))
             
             # Filter by keyword search
             keyword_search = filters.get('keyword_search', '').strip()
             if keyword_search:
                 filtered_reports = self._filter_by_keyword(filtered_reports, keyword_search)
-                self.logger.debug(f"After keyword filter: {len(filtered_reports)} reports")
+                self.logger.debug("After keyword filter: %s reports", len(filtered_reports))
             
             # Filter by AI summary presence
             show_ai_summaries = filters.get('show_ai_summaries')
@@ -247,14 +260,14 @@ class ReportAnalytics:
                     report for report in filtered_reports
                     if report.get('ai_summary') is not None and report.get('ai_summary', '').strip()
                 ]
-                self.logger.debug(f"After AI summary filter: {len(filtered_reports)} reports")
+                self.logger.debug("After AI summary filter: %s reports", len(filtered_reports))
             # When False or None, show all reports (no filtering by AI summary status)
             
-            self.logger.info(f"Filtered {len(reports)} reports down to {len(filtered_reports)}")
+            self.logger.info("Filtered %s reports down to %s", len(reports), len(filtered_reports))
             return filtered_reports
             
         except Exception as e:
-            self.logger.error(f"Error filtering reports: {str(e)}")
+            self.logger.error("Error filtering reports: %s", e)
             return reports  # Return original reports if filtering fails
     
     def generate_chart_data(self, reports: List[Dict]) -> Dict[str, Any]:
@@ -271,9 +284,10 @@ class ReportAnalytics:
             - timeline_data: Data for timeline chart
         """
         try:
+            overview = self.calculate_overview(reports)
             chart_data = {
-                'subdomain_counts': self.get_subdomain_counts(reports),
-                'port_distribution': self.get_port_distribution(reports),
+                'subdomain_counts': overview['subdomain_counts'],
+                'port_distribution': overview['port_distribution'],
                 'timeline_data': self.get_timeline_data(reports)
             }
             
@@ -281,7 +295,7 @@ class ReportAnalytics:
             return chart_data
             
         except Exception as e:
-            self.logger.error(f"Error generating chart data: {str(e)}")
+            self.logger.error("Error generating chart data: %s", e)
             return {
                 'subdomain_counts': {},
                 'port_distribution': {},
@@ -307,7 +321,7 @@ class ReportAnalytics:
                     targets.add(target.strip())
                     
         except Exception as e:
-            self.logger.error(f"Error extracting unique targets: {str(e)}")
+            self.logger.error("Error extracting unique targets: %s", e)
             
         return sorted(list(targets))
     
@@ -332,7 +346,7 @@ class ReportAnalytics:
                         dates.append(parsed_date)
                         
         except Exception as e:
-            self.logger.error(f"Error calculating date range: {str(e)}")
+            self.logger.error("Error calculating date range: %s", e)
             
         if not dates:
             return None, None
@@ -343,29 +357,16 @@ class ReportAnalytics:
         """
         Parse a date string into a datetime object.
         
+        Results are memoized per distinct string, since reports share a small set
+        of scan dates and each miss otherwise raises and catches several ValueErrors.
+        
         Args:
             date_string: Date string to parse
             
         Returns:
             Parsed datetime object or None if parsing fails
         """
-        # Common date formats to try
-        date_formats = [
-            '%Y-%m-%d',
-            '%Y/%m/%d',
-            '%d-%m-%Y',
-            '%d/%m/%Y',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y/%m/%d %H:%M:%S'
-        ]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_string.strip(), fmt)
-            except ValueError:
-                continue
-                
-        return None
+        return _parse_date_string(date_string)
     
     def _filter_by_date_range(self, reports: List[Dict], start_date: datetime, end_date: datetime) -> List[Dict]:
         """
@@ -397,7 +398,7 @@ class ReportAnalytics:
                     if start_date_only <= scan_date_only <= end_date_only:
                         filtered_reports.append(report)
             except Exception as e:
-                self.logger.warning(f"Error parsing date for filtering: {str(e)}")
+                self.logger.warning("Error parsing date for filtering: %s", e)
                 continue
                 
         return filtered_reports
@@ -477,7 +478,7 @@ class ReportAnalytics:
                     filtered_reports.append(report)
                     
             except Exception as e:
-                self.logger.warning(f"Error searching in report: {str(e)}")
+                self.logger.warning("Error searching in report: %s", e)
                 continue
                 
         return filtered_reports
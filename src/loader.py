@@ -8,9 +8,29 @@ validating their structure, and providing error handling for malformed files.
 import json
 import os
 import logging
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Severity levels in display order; anything else is treated as 'low'
+SEVERITY_LEVELS = ('critical', 'high', 'medium', 'low')
+
+
+class NormalizedVulnerability(NamedTuple):
+    """Vulnerability fields coerced once at load time for display."""
+    severity: str
+    title: str
+    description: str
+    service: str
+    cve_id: Optional[str]
+
 
 class ReportLoader:
     """
@@ -20,10 +40,16 @@ class ReportLoader:
     parse them according to the expected schema, and validate their structure.
     """
     
-    def __init__(self):
-        """Initialize the ReportLoader."""
+    def __init__(self, max_workers: int = 8):
+        """
+        Initialize the ReportLoader.
+        
+        Args:
+            max_workers: Maximum number of report files read and parsed concurrently
+        """
         self.logger = logging.getLogger(__name__)
         self.errors = []  # Track loading errors
+        self.max_workers = max_workers
         
     def load_reports(self, directory_path: str) -> List[Dict]:
         """
@@ -40,7 +66,7 @@ class ReportLoader:
         
         # Check if directory exists
         if not os.path.exists(directory_path):
-            self.logger.warning(f"Reports directory does not exist: {directory_path}")
+            self.logger.warning("Reports directory does not exist: %s", directory_path)
             self.errors.append(f"Reports directory does not exist: {directory_path}")
             return reports
             
@@ -48,16 +74,24 @@ class ReportLoader:
         json_files = self.get_report_files(directory_path)
         
         if not json_files:
-            self.logger.info(f"No JSON files found in directory: {directory_path}")
+            self.logger.info("No JSON files found in directory: %s", directory_path)
             return reports
             
-        # Process each JSON file
-        for file_path in json_files:
+        # Read and parse files concurrently; results keep the directory order
+        workers = max(1, min(self.max_workers, len(json_files)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parsed_reports = list(executor.map(self._parse_json_report, json_files))
+            
+        # Validate each parsed report
+        for file_path, report in zip(json_files, parsed_reports):
             try:
-                report = self._parse_json_report(file_path)
                 if report and self.validate_report_schema(report):
+                    # Normalize vulnerabilities once at ingest so views never re-coerce them
+                    normalized = normalize_vulnerabilities(report['vulnerabilities'])
+                    report['_vulnerabilities'] = normalized
+                    report['_vulnerabilities_by_severity'] = group_by_severity(normalized)
                     reports.append(report)
-                    self.logger.debug(f"Successfully loaded report: {file_path}")
+                    self.logger.debug("Successfully loaded report: %s", file_path)
                 elif report is None:
                     # JSON parsing failed
                     error_msg = f"Failed to parse JSON file: {os.path.basename(file_path)}"
@@ -69,12 +103,12 @@ class ReportLoader:
                     self.errors.append(error_msg)
                     self.logger.warning(error_msg)
             except Exception as e:
-                error_msg = f"Error processing file {os.path.basename(file_path)}: {str(e)}"
+                error_msg = f"Error processing file {os.path.basename(file_path)}: {e}"
                 self.errors.append(error_msg)
                 self.logger.error(error_msg)
                 continue
                 
-        self.logger.info(f"Loaded {len(reports)} valid reports from {len(json_files)} files")
+        self.logger.info("Loaded %s valid reports from %s files", len(reports), len(json_files))
         return reports
     
     def get_report_files(self, directory_path: str) -> List[str]:
@@ -90,12 +124,12 @@ class ReportLoader:
         json_files = []
         
         try:
-            for filename in os.listdir(directory_path):
-                if filename.lower().endswith('.json'):
-                    file_path = os.path.join(directory_path, filename)
-                    json_files.append(file_path)
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith('.json'):
+                        json_files.append(entry.path)
         except OSError as e:
-            self.logger.error(f"Error accessing directory {directory_path}: {str(e)}")
+            self.logger.error("Error accessing directory %s: %s", directory_path, e)
             
         return json_files
     
@@ -110,20 +144,23 @@ class ReportLoader:
             Parsed JSON data as dictionary, or None if parsing fails
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                return data
+            with open(file_path, 'rb') as file:
+                raw_data = file.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            if ORJSON_AVAILABLE:
+                return orjson.loads(raw_data)
+            return json.loads(raw_data)
         except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON in file {file_path}: {str(e)}")
+            self.logger.error("Invalid JSON in file %s: %s", file_path, e)
             return None
         except FileNotFoundError:
-            self.logger.error(f"File not found: {file_path}")
+            self.logger.error("File not found: %s", file_path)
             return None
         except PermissionError:
-            self.logger.error(f"Permission denied reading file: {file_path}")
+            self.logger.error("Permission denied reading file: %s", file_path)
             return None
         except Exception as e:
-            self.logger.error(f"Unexpected error reading file {file_path}: {str(e)}")
+            self.logger.error("Unexpected error reading file %s: %s", file_path, e)
             return None
     
     def validate_report_schema(self, report: Dict) -> bool:
@@ -155,7 +192,7 @@ class ReportLoader:
         
         for field in required_fields:
             if field not in report:
-                self.logger.error(f"Missing required field: {field}")
+                self.logger.error("Missing required field: %s", field)
                 return False
                 
         # Validate field types
@@ -204,7 +241,7 @@ class ReportLoader:
                     return False
                     
         except Exception as e:
-            self.logger.error(f"Error validating report schema: {str(e)}")
+            self.logger.error("Error validating report schema: %s", e)
             return False
             
         return True
@@ -221,4 +258,49 @@ def parse_json_report(file_path: str) -> Optional[Dict]:
         Parsed JSON data as dictionary, or None if parsing fails
     """
     loader = ReportLoader()
-    return loader._parse_json_report(file_path)
\ No newline at end of file
+    return loader._parse_json_report(file_path)
+
+
+def normalize_vulnerabilities(vulnerabilities: List[Dict]) -> List[NormalizedVulnerability]:
+    """
+    Coerce vulnerabilities into NormalizedVulnerability tuples.
+    
+    Severities are lowercased, and unknown or non-string severities fall back
+    to 'low'. Expects entries that passed validate_report_schema, i.e. dictionaries.
+    
+    Args:
+        vulnerabilities: List of vulnerability dictionaries from a report
+        
+    Returns:
+        List of normalized vulnerabilities in report order
+    """
+    normalized = []
+    for vuln in vulnerabilities:
+        severity = vuln.get('severity', 'low')
+        severity = severity.lower() if isinstance(severity, str) else 'low'
+        if severity not in SEVERITY_LEVELS:
+            severity = 'low'
+        normalized.append(NormalizedVulnerability(
+            severity,
+            str(vuln.get('title', 'Unknown Vulnerability')),
+            str(vuln.get('description', 'No description available')),
+            str(vuln.get('affected_service', 'Unknown')),
+            vuln.get('cve_id') or None
+        ))
+    return normalized
+
+
+def group_by_severity(vulnerabilities: List[NormalizedVulnerability]) -> Dict[str, List[NormalizedVulnerability]]:
+    """
+    Group normalized vulnerabilities by severity in a single pass.
+    
+    Args:
+        vulnerabilities: Normalized vulnerabilities from normalize_vulnerabilities
+        
+    Returns:
+        Dictionary mapping every severity level, in display order, to its vulnerabilities
+    """
+    groups = {severity: [] for severity in SEVERITY_LEVELS}
+    for vuln in vulnerabilities:
+        groups[vuln.severity].append(vuln)
+    return groups
@@ -0,0 +1,117 @@
+"""
+Client-side rate limiting module for AI Threat Hunting Dashboard.
+
+This module provides thread-safe token buckets that hold API requests back
+until they fit within the provider's request and token budgets, so bursts
+wait briefly up front instead of being rejected with HTTP 429 and retried.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at a fixed rate.
+    
+    The bucket starts full, so up to `capacity` tokens can be taken at once;
+    after that, tokens become available at `rate_per_minute`.
+    """
+    
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize the TokenBucket.
+        
+        Args:
+            rate_per_minute: Number of tokens added to the bucket per minute
+            capacity: Maximum number of stored tokens (defaults to one minute's worth)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update. Caller must hold the lock."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, going into debt if necessary.
+        
+        Requests larger than the capacity are clamped to it so they can
+        still be served once the bucket is full.
+        
+        Args:
+            tokens: Number of tokens to take
+        
+        Returns:
+            Number of seconds the caller must wait before proceeding
+        """
+        tokens = min(float(tokens), self.capacity)
+        with self._lock:
+            self._refill()
+            self.tokens -= tokens
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until the requested tokens are available.
+        
+        Args:
+            tokens: Number of tokens to take
+        
+        Returns:
+            Number of seconds spent waiting
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """
+    Combined requests-per-minute and tokens-per-minute limiter for an API client.
+    
+    Each call to acquire() takes one request from the request bucket and the
+    estimated token count from the token bucket, then waits for whichever
+    budget is further behind.
+    """
+    
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None):
+        """
+        Initialize the RateLimiter.
+        
+        Args:
+            requests_per_minute: Maximum number of requests per minute
+            tokens_per_minute: Optional maximum number of tokens per minute
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+    
+    def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Block until one request with the given token estimate fits in the budget.
+        
+        Args:
+            estimated_tokens: Estimated prompt plus completion tokens for the request
+        
+        Returns:
+            Number of seconds spent waiting
+        """
+        delay = self.requests.reserve(1)
+        if self.tokens is not None and estimated_tokens > 0:
+            delay = max(delay, self.tokens.reserve(estimated_tokens))
+        if delay > 0:
+            time.sleep(delay)
+        return delay